@@ -0,0 +1,37 @@
+"""Shared python-amazon-sp-api clients.
+
+Each sp_api client owns its own HTTP connection pool, so constructing one
+per request pays a fresh TCP + TLS handshake every time. These helpers hand
+out one client per credential set for the life of the process; the
+underlying HTTP client is thread-safe, so worker threads share it too.
+"""
+
+from functools import lru_cache
+
+from sp_api.api import ListingsItems, Reports
+from sp_api.base import Marketplaces
+
+
+def _credentials_key(credentials: dict) -> tuple[tuple[str, str], ...]:
+    """Hashable, order-independent key for a credentials dict."""
+    return tuple(sorted(credentials.items()))
+
+
+@lru_cache(maxsize=4)
+def _reports_client(credentials_key: tuple[tuple[str, str], ...]) -> Reports:
+    return Reports(credentials=dict(credentials_key), marketplace=Marketplaces.US)
+
+
+@lru_cache(maxsize=4)
+def _listings_client(credentials_key: tuple[tuple[str, str], ...]) -> ListingsItems:
+    return ListingsItems(credentials=dict(credentials_key), marketplace=Marketplaces.US)
+
+
+def get_reports_api(credentials: dict) -> Reports:
+    """Get the shared Reports API client for these credentials."""
+    return _reports_client(_credentials_key(credentials))
+
+
+def get_listings_api(credentials: dict) -> ListingsItems:
+    """Get the shared Listings Items API client for these credentials."""
+    return _listings_client(_credentials_key(credentials))
@@ -1,27 +1,36 @@
 """SP-API authentication using Login with Amazon (LWA)."""
 
+import hashlib
+import json
+import os
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import requests
 
-from ..config import SPAPIConfig
+from ..config import SPAPIConfig, get_cache_dir
 
 
 LWA_TOKEN_URL = "https://api.amazon.com/auth/o2/token"
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessToken:
     """LWA access token with expiry tracking."""
 
     token: str
     expires_at: float
+    refresh_at: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Refresh 60s before actual expiry
+        self.refresh_at = self.expires_at - 60
 
     def is_expired(self) -> bool:
         """Check if token is expired (with 60s buffer)."""
-        return time.time() >= (self.expires_at - 60)
+        return time.time() >= self.refresh_at
 
 
 class SPAPIAuth:
@@ -29,13 +38,26 @@ class SPAPIAuth:
 
     def __init__(self, config: SPAPIConfig):
         self.config = config
-        self._access_token: AccessToken | None = None
+        # Tokens are per seller authorization, so key on both client and refresh token
+        client_hash = hashlib.sha256(
+            f"{config.client_id}\0{config.refresh_token}".encode()
+        ).hexdigest()[:16]
+        self._cache_path = get_cache_dir() / f"lwa_{client_hash}.json"
+        self._lock = threading.Lock()
+        self._access_token: AccessToken | None = self._load_from_disk()
 
     def get_access_token(self) -> str:
         """Get valid access token, refreshing if necessary."""
-        if self._access_token is None or self._access_token.is_expired():
-            self._refresh_token()
-        return self._access_token.token
+        token = self._access_token
+        if token is not None and time.time() < token.refresh_at:
+            return token.token
+
+        # One refresh for all threads; latecomers reuse the fresh token
+        with self._lock:
+            token = self._access_token
+            if token is None or time.time() >= token.refresh_at:
+                self._refresh_token()
+            return self._access_token.token
 
     def _refresh_token(self) -> None:
         """Refresh the access token using the refresh token."""
@@ -59,6 +81,42 @@ class SPAPIAuth:
             token=data["access_token"],
             expires_at=time.time() + expires_in,
         )
+        self._persist()
+
+    def _load_from_disk(self) -> AccessToken | None:
+        """Load a cached token from disk, or None if missing or expired."""
+        try:
+            with open(self._cache_path) as f:
+                data = json.load(f)
+            token = AccessToken(token=data["token"], expires_at=data["expires_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        return None if token.is_expired() else token
+
+    def _persist(self) -> None:
+        """Write the current token to disk (mode 0600) so other runs can reuse it."""
+        if self._access_token is None:
+            return
+
+        tmp_path = self._cache_path.with_name(
+            f"{self._cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {
+                        "token": self._access_token.token,
+                        "expires_at": self._access_token.expires_at,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self._cache_path)
+        except OSError:
+            # Cache is best-effort; the in-memory token is still valid
+            tmp_path.unlink(missing_ok=True)
 
     def get_auth_headers(self) -> dict[str, str]:
         """Get headers required for SP-API requests."""
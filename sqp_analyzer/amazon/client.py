@@ -2,22 +2,81 @@
 
 import hashlib
 import hmac
+import json
+import threading
 import time
-from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 from typing import Any
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..config import SPAPIConfig
 from .auth import SPAPIAuth
 from .models import APIResponse, SearchQueryMetrics, SQPReport
+from .ratelimit import TokenBucket
 
 
 # SP-API endpoints
 SP_API_BASE_URL = "https://sellingpartnerapi-na.amazon.com"
 SQP_ENDPOINT = "/analytics/brandAnalytics/v1/searchQueryPerformance"
 
+# Brand Analytics allows 1 request per second
+SQP_RATE_LIMIT = 1.0
+MAX_CONCURRENT_REQUESTS = 8
+
+# SigV4 constants (AWS region for SP-API NA endpoint)
+_REGION = "us-east-1"
+_SERVICE = "execute-api"
+_HOST = "sellingpartnerapi-na.amazon.com"
+_ALGORITHM = "AWS4-HMAC-SHA256"
+_SIGNED_HEADERS = "host;x-amz-date"
+_SCOPE_SUFFIX = f"/{_REGION}/{_SERVICE}/aws4_request"
+_EMPTY_PAYLOAD_HASH = hashlib.sha256(b"").hexdigest()
+_SIGNING_KEY_CACHE_SIZE = 4
+
+# Shared fallback for missing nested objects in SQP responses
+_EMPTY: dict[str, Any] = {}
+
+
+def _parse_query_metrics(
+    query_data: dict[str, Any], asin: str, reporting_date: date
+) -> SearchQueryMetrics:
+    """Build SearchQueryMetrics from one searchQueries entry in a single call."""
+    get = query_data.get
+    imp_get = (get("impressions") or _EMPTY).get
+    clk_get = (get("clicks") or _EMPTY).get
+    pur_get = (get("purchases") or _EMPTY).get
+    price_get = (get("pricing") or _EMPTY).get
+
+    return SearchQueryMetrics(
+        search_query=get("searchQuery", ""),
+        search_volume=get("searchVolume", 0),
+        search_score=get("searchScore", 0.0),
+        impressions_total=imp_get("totalCount", 0),
+        impressions_asin=imp_get("asinCount", 0),
+        impressions_share=imp_get("asinShare", 0.0),
+        clicks_total=clk_get("totalCount", 0),
+        clicks_asin=clk_get("asinCount", 0),
+        clicks_share=clk_get("asinShare", 0.0),
+        purchases_total=pur_get("totalCount", 0),
+        purchases_asin=pur_get("asinCount", 0),
+        purchases_share=pur_get("asinShare", 0.0),
+        asin_price=price_get("asinPrice"),
+        market_price=price_get("marketPrice"),
+        asin=asin,
+        reporting_date=reporting_date,
+    )
+
+
+def _amz_timestamps() -> tuple[str, str]:
+    """Get the current UTC (amz_date, date_stamp) pair for SigV4."""
+    amz_date = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+    return amz_date, amz_date[:8]
+
 
 class BrandAnalyticsClient:
     """Client for Amazon Brand Analytics API."""
@@ -26,6 +85,46 @@ class BrandAnalyticsClient:
         self.config = config
         self.auth = SPAPIAuth(config)
         self._session = requests.Session()
+        # Single host, so one pool sized for the concurrent weekly fetches
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=1.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                respect_retry_after_header=True,
+                # Hand the final error response back to _make_request
+                raise_on_status=False,
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.headers.update({"Accept-Encoding": "gzip"})
+        self._rate_limiter = TokenBucket(rate=SQP_RATE_LIMIT, capacity=1)
+        self._signing_key_cache: dict[str, bytes] = {}
+        self._signing_key_lock = threading.Lock()
+
+    def _get_signing_key(self, date_stamp: str) -> bytes:
+        """Get the SigV4 signing key for a date, computing it once per day."""
+        key = self._signing_key_cache.get(date_stamp)
+        if key is not None:
+            return key
+
+        def sign(key: bytes, msg: str) -> bytes:
+            return hmac.new(key, msg.encode(), hashlib.sha256).digest()
+
+        k_date = sign(f"AWS4{self.config.aws_secret_key}".encode(), date_stamp)
+        k_region = sign(k_date, _REGION)
+        k_service = sign(k_region, _SERVICE)
+        key = sign(k_service, "aws4_request")
+
+        # Evict the oldest date once the cache is full (dicts keep insert order)
+        with self._signing_key_lock:
+            if len(self._signing_key_cache) >= _SIGNING_KEY_CACHE_SIZE:
+                del self._signing_key_cache[next(iter(self._signing_key_cache))]
+            self._signing_key_cache[date_stamp] = key
+        return key
 
     def _sign_request(
         self,
@@ -36,52 +135,35 @@ class BrandAnalyticsClient:
     ) -> dict[str, str]:
         """Sign request using AWS Signature Version 4."""
         # Get current timestamp
-        t = datetime.utcnow()
-        amz_date = t.strftime("%Y%m%dT%H%M%SZ")
-        date_stamp = t.strftime("%Y%m%d")
-
-        # AWS region for SP-API NA endpoint
-        region = "us-east-1"
-        service = "execute-api"
+        amz_date, date_stamp = _amz_timestamps()
 
         # Create canonical request
         canonical_uri = url.split(SP_API_BASE_URL)[-1].split("?")[0]
         canonical_querystring = urlencode(sorted(params.items())) if params else ""
-
-        # Headers to sign
-        host = "sellingpartnerapi-na.amazon.com"
-        signed_headers = "host;x-amz-date"
-        canonical_headers = f"host:{host}\nx-amz-date:{amz_date}\n"
-
-        payload_hash = hashlib.sha256(b"").hexdigest()
-
-        canonical_request = (
-            f"{method}\n"
-            f"{canonical_uri}\n"
-            f"{canonical_querystring}\n"
-            f"{canonical_headers}\n"
-            f"{signed_headers}\n"
-            f"{payload_hash}"
+        canonical_request = "\n".join(
+            (
+                method,
+                canonical_uri,
+                canonical_querystring,
+                f"host:{_HOST}\nx-amz-date:{amz_date}\n",
+                _SIGNED_HEADERS,
+                _EMPTY_PAYLOAD_HASH,
+            )
         )
 
         # Create string to sign
-        algorithm = "AWS4-HMAC-SHA256"
-        credential_scope = f"{date_stamp}/{region}/{service}/aws4_request"
-        string_to_sign = (
-            f"{algorithm}\n"
-            f"{amz_date}\n"
-            f"{credential_scope}\n"
-            f"{hashlib.sha256(canonical_request.encode()).hexdigest()}"
+        credential_scope = date_stamp + _SCOPE_SUFFIX
+        string_to_sign = "\n".join(
+            (
+                _ALGORITHM,
+                amz_date,
+                credential_scope,
+                hashlib.sha256(canonical_request.encode()).hexdigest(),
+            )
         )
 
-        # Create signing key
-        def sign(key: bytes, msg: str) -> bytes:
-            return hmac.new(key, msg.encode(), hashlib.sha256).digest()
-
-        k_date = sign(f"AWS4{self.config.aws_secret_key}".encode(), date_stamp)
-        k_region = sign(k_date, region)
-        k_service = sign(k_region, service)
-        k_signing = sign(k_service, "aws4_request")
+        # Get signing key (cached per date)
+        k_signing = self._get_signing_key(date_stamp)
 
         # Create signature
         signature = hmac.new(
@@ -90,9 +172,9 @@ class BrandAnalyticsClient:
 
         # Create authorization header
         authorization = (
-            f"{algorithm} "
+            f"{_ALGORITHM} "
             f"Credential={self.config.aws_access_key}/{credential_scope}, "
-            f"SignedHeaders={signed_headers}, "
+            f"SignedHeaders={_SIGNED_HEADERS}, "
             f"Signature={signature}"
         )
 
@@ -113,7 +195,8 @@ class BrandAnalyticsClient:
         # Get LWA token
         headers = self.auth.get_auth_headers()
 
-        # Sign request
+        # Wait for a rate limit slot, then sign so x-amz-date is fresh
+        self._rate_limiter.acquire()
         headers = self._sign_request(method, url, headers, params)
 
         try:
@@ -125,14 +208,21 @@ class BrandAnalyticsClient:
                 timeout=30,
             )
 
+            # Decode the raw bytes directly; json.loads detects UTF-8/16/32
             if response.status_code == 200:
-                return APIResponse.from_success(response.json())
-            else:
-                error_data = response.json() if response.text else {}
-                return APIResponse.from_error(
-                    code=str(response.status_code),
-                    message=error_data.get("message", response.text),
-                )
+                try:
+                    return APIResponse.from_success(json.loads(response.content))
+                except ValueError as e:
+                    return APIResponse.from_error(code="PARSE_ERROR", message=str(e))
+
+            try:
+                error_data = json.loads(response.content) if response.content else {}
+            except ValueError:
+                error_data = {}
+            return APIResponse.from_error(
+                code=str(response.status_code),
+                message=error_data.get("message", response.text),
+            )
 
         except requests.RequestException as e:
             return APIResponse.from_error(code="REQUEST_ERROR", message=str(e))
@@ -191,39 +281,10 @@ class BrandAnalyticsClient:
             "searchQueries", data.get("payload", {}).get("searchQueries", [])
         )
 
-        for query_data in queries_data:
-            metrics = SearchQueryMetrics(
-                search_query=query_data.get("searchQuery", ""),
-                search_volume=query_data.get("searchVolume", 0),
-                search_score=query_data.get("searchScore", 0.0),
-                asin=asin,
-                reporting_date=start_date,
-            )
-
-            # Parse impressions
-            impressions = query_data.get("impressions", {})
-            metrics.impressions_total = impressions.get("totalCount", 0)
-            metrics.impressions_asin = impressions.get("asinCount", 0)
-            metrics.impressions_share = impressions.get("asinShare", 0.0)
-
-            # Parse clicks
-            clicks = query_data.get("clicks", {})
-            metrics.clicks_total = clicks.get("totalCount", 0)
-            metrics.clicks_asin = clicks.get("asinCount", 0)
-            metrics.clicks_share = clicks.get("asinShare", 0.0)
-
-            # Parse purchases
-            purchases = query_data.get("purchases", {})
-            metrics.purchases_total = purchases.get("totalCount", 0)
-            metrics.purchases_asin = purchases.get("asinCount", 0)
-            metrics.purchases_share = purchases.get("asinShare", 0.0)
-
-            # Parse pricing if available
-            pricing = query_data.get("pricing", {})
-            metrics.asin_price = pricing.get("asinPrice")
-            metrics.market_price = pricing.get("marketPrice")
-
-            report.queries.append(metrics)
+        report.queries = [
+            _parse_query_metrics(query_data, asin, start_date)
+            for query_data in queries_data
+        ]
 
         return report
 
@@ -241,22 +302,25 @@ class BrandAnalyticsClient:
         Returns:
             List of APIResponses, one per week
         """
-        reports = []
         today = date.today()
 
+        # Calculate week boundaries (Monday to Sunday) up front
+        week_ranges = []
         for week_offset in range(weeks):
-            # Calculate week boundaries (Monday to Sunday)
             end_date = today - timedelta(days=today.weekday() + 1 + (week_offset * 7))
             start_date = end_date - timedelta(days=6)
-
-            # Rate limiting - 1 request per second
-            if week_offset > 0:
-                time.sleep(1)
-
-            report = self.get_sqp_report(asin, start_date, end_date)
-            reports.append(report)
-
-        return reports
+            week_ranges.append((start_date, end_date))
+
+        # Requests run concurrently; the shared token bucket in _make_request
+        # keeps them under the SP-API rate limit
+        max_workers = max(1, min(MAX_CONCURRENT_REQUESTS, len(week_ranges)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda week: self.get_sqp_report(asin, week[0], week[1]),
+                    week_ranges,
+                )
+            )
 
     def test_connection(self) -> dict[str, Any]:
         """Test SP-API connection.
@@ -0,0 +1,57 @@
+"""Download helpers for SP-API report documents."""
+
+import gzip
+import io
+import json
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) timeouts in seconds for report document downloads
+DOWNLOAD_TIMEOUT = (5, 60)
+
+
+def _build_session() -> requests.Session:
+    """Create a pooled session that retries throttling and server errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared across commands and worker threads so TLS connections to the
+# document host are reused instead of re-negotiated per download.
+_SESSION = _build_session()
+
+
+def download_report_document(url: str, compression: str | None = None) -> Any:
+    """Download a report document and parse its JSON content.
+
+    The body is streamed through the decompressor into the JSON parser, so
+    the compressed and decoded text never have to be held in memory at once.
+
+    Args:
+        url: Pre-signed document URL from get_report_document
+        compression: compressionAlgorithm from the document payload ("GZIP")
+
+    Returns:
+        Parsed JSON document
+    """
+    with _SESSION.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+        response.raise_for_status()
+        raw = response.raw
+        raw.decode_content = True
+        source = gzip.GzipFile(fileobj=raw) if compression == "GZIP" else raw
+        return json.load(io.TextIOWrapper(source, encoding="utf-8"))
@@ -5,7 +5,7 @@ from datetime import date
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchQueryMetrics:
     """Metrics for a single search query."""
 
@@ -60,7 +60,7 @@ class SearchQueryMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SQPReport:
     """Search Query Performance report for a date range."""
 
@@ -81,7 +81,7 @@ class SQPReport:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class APIResponse:
     """Generic SP-API response wrapper."""
 
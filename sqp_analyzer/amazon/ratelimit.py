@@ -0,0 +1,37 @@
+"""Thread-safe token bucket for SP-API rate limits."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Token bucket rate limiter shared across worker threads.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Each call to ``acquire`` consumes one token, blocking until one is
+    available. This mirrors how SP-API documents its limits (rate + burst).
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated_at
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
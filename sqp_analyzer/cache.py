@@ -0,0 +1,56 @@
+"""On-disk cache for completed SP-API report documents.
+
+Reports are immutable once processing is DONE, so a parsed document can be
+reused across runs instead of being downloaded and decompressed again.
+Entries are stored as gzipped JSON under ``get_cache_dir() / "reports"``.
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from .config import get_cache_dir
+
+# When False, lookups miss so reports are fetched fresh (and re-cached)
+_read_enabled = True
+
+
+def set_report_cache_reads(enabled: bool) -> None:
+    """Enable or disable reading from the report cache (e.g., for --no-cache)."""
+    global _read_enabled
+    _read_enabled = enabled
+
+
+def report_cache_path(key: str) -> Path:
+    """Get the cache file path for a report key (e.g. a report ID)."""
+    return get_cache_dir() / "reports" / f"{key}.json.gz"
+
+
+def load_cached_report(key: str) -> dict[str, Any] | None:
+    """Load a cached report document, or None if missing or unreadable."""
+    if not _read_enabled:
+        return None
+    try:
+        with gzip.open(report_cache_path(key), "rb") as f:
+            return json.load(f)
+    except (OSError, EOFError, ValueError):
+        return None
+
+
+def save_cached_report(key: str, data: dict[str, Any]) -> None:
+    """Write a report document to the cache.
+
+    The file is written to a temporary path and renamed so concurrent runs
+    never see a partial entry. Failures are ignored; the cache is best-effort.
+    """
+    path = report_cache_path(key)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
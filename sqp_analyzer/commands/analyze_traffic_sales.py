@@ -6,14 +6,12 @@ Usage:
 """
 
 import argparse
-import gzip
-import json
 import sys
+from functools import lru_cache
 
-import requests
-from sp_api.api import Reports
-from sp_api.base import Marketplaces
-
+from ..amazon.apis import get_reports_api
+from ..amazon.documents import download_report_document
+from ..cache import load_cached_report, save_cached_report
 from ..config import load_config
 from ..sheets.client import SheetsClient
 
@@ -32,8 +30,9 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@lru_cache(maxsize=1)
 def get_credentials() -> dict:
-    """Load SP-API credentials from environment."""
+    """Load SP-API credentials from environment (cached; do not mutate)."""
     config = load_config()
     return {
         "refresh_token": config.sp_api.refresh_token,
@@ -43,8 +42,17 @@ def get_credentials() -> dict:
 
 
 def fetch_report_data(credentials: dict, report_id: str) -> dict | None:
-    """Fetch completed report data from SP-API."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    """Fetch completed report data from SP-API.
+
+    Completed reports never change, so documents are cached on disk by
+    report ID and later runs for the same ID skip the download entirely.
+    """
+    cache_key = f"report-{report_id}"
+    cached = load_cached_report(cache_key)
+    if cached is not None:
+        return cached
+
+    report = get_reports_api(credentials)
 
     res = report.get_report(reportId=report_id)
     status = res.payload.get("processingStatus")
@@ -61,33 +69,20 @@ def fetch_report_data(credentials: dict, report_id: str) -> dict | None:
     doc_res = report.get_report_document(reportDocumentId=doc_id, download=False)
     url = doc_res.payload.get("url")
 
-    response = requests.get(url)
-    if doc_res.payload.get("compressionAlgorithm") == "GZIP":
-        data = gzip.decompress(response.content).decode("utf-8")
-    else:
-        data = response.text
+    data = download_report_document(url, doc_res.payload.get("compressionAlgorithm"))
 
-    return json.loads(data)
+    save_cached_report(cache_key, data)
+    return data
 
 
 def write_to_sheets(config, report_data: dict) -> None:
     """Write traffic and sales data to Google Sheets."""
     sheets = SheetsClient(config.sheets)
-    spreadsheet = sheets._get_spreadsheet()
-
-    # Get or create worksheets
-    def get_or_create_worksheet(name: str, rows: int = 1000, cols: int = 20):
-        try:
-            return spreadsheet.worksheet(name)
-        except Exception:
-            return spreadsheet.add_worksheet(title=name, rows=rows, cols=cols)
+    tabs: dict[str, list[list]] = {}
 
-    # Write Sales by Date
+    # Sales by Date
     sales_by_date = report_data.get("salesAndTrafficByDate", [])
     if sales_by_date:
-        ws = get_or_create_worksheet("Traffic-ByDate")
-        ws.clear()
-
         headers = [
             "Date",
             "Units Ordered",
@@ -124,15 +119,11 @@ def write_to_sheets(config, report_data: dict) -> None:
                 ]
             )
 
-        ws.update("A1", rows)
-        print(f"  Wrote {len(sales_by_date)} rows to Traffic-ByDate")
+        tabs["Traffic-ByDate"] = rows
 
-    # Write Sales by ASIN
+    # Sales by ASIN
     sales_by_asin = report_data.get("salesAndTrafficByAsin", [])
     if sales_by_asin:
-        ws = get_or_create_worksheet("Traffic-ByASIN")
-        ws.clear()
-
         headers = [
             "ASIN",
             "Parent ASIN",
@@ -177,8 +168,12 @@ def write_to_sheets(config, report_data: dict) -> None:
                 ]
             )
 
-        ws.update("A1", rows)
-        print(f"  Wrote {len(sales_by_asin)} rows to Traffic-ByASIN")
+        tabs["Traffic-ByASIN"] = rows
+
+    # Both tabs go out in a single batch clear + batch update
+    sheets.write_tabs(tabs)
+    for name, rows in tabs.items():
+        print(f"  Wrote {len(rows) - 1} rows to {name}")
 
 
 def main() -> int:
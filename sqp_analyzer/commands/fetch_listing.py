@@ -10,16 +10,26 @@ Usage:
 
 import argparse
 import sys
+from functools import lru_cache
 
+import requests
 from sp_api.api import ListingsItems
-from sp_api.base import Marketplaces
-
+from sp_api.base import (
+    Marketplaces,
+    SellingApiBadRequestException,
+    SellingApiException,
+    SellingApiForbiddenException,
+    SellingApiNotFoundException,
+)
+
+from ..amazon.apis import get_listings_api
 from ..config import load_config
 from ..models import ListingContent
 
 
+@lru_cache(maxsize=1)
 def get_credentials() -> dict:
-    """Load SP-API credentials from environment."""
+    """Load SP-API credentials from environment (cached; do not mutate)."""
     config = load_config()
     return {
         "refresh_token": config.sp_api.refresh_token,
@@ -28,77 +38,173 @@ def get_credentials() -> dict:
     }
 
 
-def get_listing_content(seller_id: str, sku: str) -> ListingContent | None:
-    """Fetch listing title, bullets, and backend keywords.
+# Amazon US marketplace
+MARKETPLACE_ID = "ATVPDKIKX0DER"
+
+# searchListingsItems accepts at most 20 SKU identifiers per request
+LISTINGS_SEARCH_BATCH = 20
+
+
+def _parse_listing_item(item: dict, sku: str) -> ListingContent:
+    """Build ListingContent from a Listings Items API item payload.
 
     Args:
-        seller_id: Amazon Seller ID
+        item: Item with "summaries" and "attributes" (from get or search)
         sku: Product SKU
 
     Returns:
-        ListingContent with title, bullets, and backend keywords,
-        or None if listing not found
+        ListingContent with title, bullets, and backend keywords
     """
-    credentials = get_credentials()
+    attrs = item.get("attributes", {})
+    summaries = item.get("summaries", [{}])
+    summary = summaries[0] if summaries else {}
+
+    # Extract ASIN from identifiers or summary
+    asin = summary.get("asin", "")
+    if not asin:
+        identifiers = attrs.get("externally_assigned_product_identifier", [])
+        for ident in identifiers:
+            if ident.get("type") == "asin":
+                asin = ident.get("value", "")
+                break
+
+    # Extract title
+    title = summary.get("itemName", "")
+
+    # Extract bullet points
+    bullets = []
+    bullet_attrs = attrs.get("bullet_point", [])
+    for bullet in bullet_attrs:
+        value = bullet.get("value", "")
+        if value:
+            bullets.append(value)
+
+    # Extract backend keywords (generic_keyword)
+    backend_keywords = []
+    generic_keywords = attrs.get("generic_keyword", [])
+    for kw in generic_keywords:
+        value = kw.get("value", "")
+        if value:
+            backend_keywords.append(value)
+
+    return ListingContent(
+        asin=asin,
+        sku=sku,
+        title=title,
+        bullets=bullets,
+        backend_keywords=backend_keywords,
+    )
+
 
+@lru_cache(maxsize=512)
+def _fetch_listing_content(seller_id: str, sku: str) -> ListingContent | None:
+    """Fetch and parse one listing, cached per (seller_id, sku).
+
+    Only successful lookups and "not found" results are cached; any other
+    error propagates, so a transient failure is retried on the next call.
+
+    Args:
+        seller_id: Amazon Seller ID
+        sku: Product SKU
+
+    Returns:
+        ListingContent, or None if the listing does not exist
+    """
+    listings = get_listings_api(get_credentials())
     try:
-        listings = ListingsItems(credentials=credentials, marketplace=Marketplaces.US)
         response = listings.get_listings_item(
             sellerId=seller_id,
             sku=sku,
-            marketplaceIds=["ATVPDKIKX0DER"],
+            marketplaceIds=[MARKETPLACE_ID],
             includedData=["summaries", "attributes"],
         )
+    except SellingApiNotFoundException:
+        return None
 
-        payload = response.payload
-        if not payload:
-            return None
-
-        attrs = payload.get("attributes", {})
-        summaries = payload.get("summaries", [{}])
-        summary = summaries[0] if summaries else {}
-
-        # Extract ASIN from identifiers or summary
-        asin = summary.get("asin", "")
-        if not asin:
-            identifiers = attrs.get("externally_assigned_product_identifier", [])
-            for ident in identifiers:
-                if ident.get("type") == "asin":
-                    asin = ident.get("value", "")
-                    break
-
-        # Extract title
-        title = summary.get("itemName", "")
-
-        # Extract bullet points
-        bullets = []
-        bullet_attrs = attrs.get("bullet_point", [])
-        for bullet in bullet_attrs:
-            value = bullet.get("value", "")
-            if value:
-                bullets.append(value)
-
-        # Extract backend keywords (generic_keyword)
-        backend_keywords = []
-        generic_keywords = attrs.get("generic_keyword", [])
-        for kw in generic_keywords:
-            value = kw.get("value", "")
-            if value:
-                backend_keywords.append(value)
-
-        return ListingContent(
-            asin=asin,
-            sku=sku,
-            title=title,
-            bullets=bullets,
-            backend_keywords=backend_keywords,
-        )
+    payload = response.payload
+    if not payload:
+        return None
 
+    return _parse_listing_item(payload, sku)
+
+
+def get_listing_content(seller_id: str, sku: str) -> ListingContent | None:
+    """Fetch listing title, bullets, and backend keywords.
+
+    Results are cached per (seller_id, sku) for the life of the process, so
+    a SKU shared by several master-sheet rows costs one Listings API call.
+    Failed lookups are not cached. The returned ListingContent is shared
+    between callers; do not mutate it.
+
+    Args:
+        seller_id: Amazon Seller ID
+        sku: Product SKU
+
+    Returns:
+        ListingContent with title, bullets, and backend keywords,
+        or None if listing not found or the lookup failed
+    """
+    try:
+        return _fetch_listing_content(seller_id, sku)
     except Exception as e:
         print(f"Error fetching listing for SKU {sku}: {e}")
         return None
 
 
+def get_listings_bulk(
+    seller_id: str, skus: list[str]
+) -> dict[str, ListingContent | None]:
+    """Fetch listing content for many SKUs with searchListingsItems.
+
+    SKUs are looked up LISTINGS_SEARCH_BATCH at a time, so a typical master
+    list costs one Listings API call instead of one per SKU. If a batch
+    request fails with a throttle, server or network error, its SKUs fall back
+    to get_listing_content one by one; auth and bad-request errors mark the
+    batch as not found instead.
+
+    Args:
+        seller_id: Amazon Seller ID
+        skus: Product SKUs
+
+    Returns:
+        Map of SKU -> ListingContent, or None if the listing was not found
+    """
+    results: dict[str, ListingContent | None] = {}
+    if not skus:
+        return results
+
+    listings = get_listings_api(get_credentials())
+
+    for i in range(0, len(skus), LISTINGS_SEARCH_BATCH):
+        batch = skus[i : i + LISTINGS_SEARCH_BATCH]
+        try:
+            response = listings.search_listings_items(
+                sellerId=seller_id,
+                marketplaceIds=[MARKETPLACE_ID],
+                identifiers=",".join(batch),
+                identifiersType="SKU",
+                includedData=["summaries", "attributes"],
+                pageSize=len(batch),
+            )
+        except (SellingApiBadRequestException, SellingApiForbiddenException) as e:
+            # Per-SKU requests would fail the same way
+            print(f"Error searching listings for {len(batch)} SKUs: {e}")
+            results.update(dict.fromkeys(batch))
+            continue
+        except (SellingApiException, requests.RequestException) as e:
+            print(f"Error searching listings for {len(batch)} SKUs: {e}")
+            for sku in batch:
+                results[sku] = get_listing_content(seller_id, sku)
+            continue
+
+        items = {item.get("sku"): item for item in response.payload.get("items", [])}
+        for sku in batch:
+            item = items.get(sku)
+            results[sku] = _parse_listing_item(item, sku) if item else None
+
+    return results
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create argument parser."""
     parser = argparse.ArgumentParser(
@@ -10,20 +10,21 @@ Usage:
 """
 
 import argparse
-import gzip
-import json
 import sys
 import time
 from datetime import date, timedelta
+from functools import lru_cache
 
-import requests
 from decouple import config
 from sp_api.api import Reports
-from sp_api.base import Marketplaces
 
+from ..amazon.apis import get_reports_api
+from ..amazon.documents import download_report_document
 
+
+@lru_cache(maxsize=1)
 def get_credentials() -> dict:
-    """Load SP-API credentials from environment."""
+    """Load SP-API credentials from environment (cached; do not mutate)."""
     return {
         "refresh_token": config("SP_API_REFRESH_TOKEN"),
         "lwa_app_id": config("SP_API_CLIENT_ID"),
@@ -96,9 +97,8 @@ def get_last_complete_week() -> tuple[date, date]:
     """Get the last complete week (Sunday to Saturday)."""
     today = date.today()
     # Find last Saturday
-    days_since_saturday = (today.weekday() + 2) % 7
-    if days_since_saturday == 0:
-        days_since_saturday = 7  # If today is Saturday, use previous week
+    # If today is Saturday, use previous week
+    days_since_saturday = (today.weekday() + 2) % 7 or 7
     last_saturday = today - timedelta(days=days_since_saturday)
     last_sunday = last_saturday - timedelta(days=6)
     return last_sunday, last_saturday
@@ -108,7 +108,7 @@ def test_connection(credentials: dict) -> bool:
     """Test the SP-API connection."""
     print("Testing SP-API connection...")
     try:
-        report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+        report = get_reports_api(credentials)
         _res = report.get_reports(
             reportTypes=["GET_MERCHANT_LISTINGS_ALL_DATA"],
             pageSize=1,
@@ -122,7 +122,7 @@ def test_connection(credentials: dict) -> bool:
 
 def list_reports(credentials: dict) -> None:
     """List recent SQP reports."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_api(credentials)
 
     print("Recent SQP Reports:")
     print("-" * 80)
@@ -148,10 +148,10 @@ def list_reports(credentials: dict) -> None:
                 reportDocumentId=r.get("reportDocumentId"),
                 download=False,
             )
-            url = doc_res.payload.get("url")
-            response = requests.get(url)
-            data = gzip.decompress(response.content).decode("utf-8")
-            error_data = json.loads(data)
+            error_data = download_report_document(
+                doc_res.payload.get("url"),
+                doc_res.payload.get("compressionAlgorithm"),
+            )
             if "errorDetails" in error_data:
                 print(f"    Error: {error_data['errorDetails']}")
 
@@ -163,7 +163,7 @@ def request_report(
     end_date: date,
 ) -> str:
     """Request a new SQP report."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_api(credentials)
 
     print("Requesting SQP report...")
     print(f"  ASIN: {asin}")
@@ -192,7 +192,7 @@ def request_report(
 
 def check_report(credentials: dict, report_id: str) -> bool:
     """Check report status and download if ready."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_api(credentials)
 
     res = report.get_report(reportId=report_id)
     status = res.payload.get("processingStatus")
@@ -205,10 +205,10 @@ def check_report(credentials: dict, report_id: str) -> bool:
         return True
     elif status == "FATAL" and doc_id:
         doc_res = report.get_report_document(reportDocumentId=doc_id, download=False)
-        url = doc_res.payload.get("url")
-        response = requests.get(url)
-        data = gzip.decompress(response.content).decode("utf-8")
-        error_data = json.loads(data)
+        error_data = download_report_document(
+            doc_res.payload.get("url"),
+            doc_res.payload.get("compressionAlgorithm"),
+        )
         print(f"Error: {error_data.get('errorDetails', 'Unknown error')}")
         return False
     elif status in ("IN_QUEUE", "IN_PROGRESS"):
@@ -222,15 +222,9 @@ def check_report(credentials: dict, report_id: str) -> bool:
 def download_and_display(report: Reports, doc_id: str) -> None:
     """Download and display report data."""
     doc_res = report.get_report_document(reportDocumentId=doc_id, download=False)
-    url = doc_res.payload.get("url")
-
-    response = requests.get(url)
-    if doc_res.payload.get("compressionAlgorithm") == "GZIP":
-        data = gzip.decompress(response.content).decode("utf-8")
-    else:
-        data = response.text
-
-    report_data = json.loads(data)
+    report_data = download_report_document(
+        doc_res.payload.get("url"), doc_res.payload.get("compressionAlgorithm")
+    )
 
     if "errorDetails" in report_data:
         print(f"Error: {report_data['errorDetails']}")
@@ -293,7 +287,7 @@ def download_and_display(report: Reports, doc_id: str) -> None:
 
 def wait_for_report(credentials: dict, report_id: str, max_wait: int = 3600) -> bool:
     """Wait for report to complete."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_api(credentials)
 
     print(f"Waiting for report {report_id} to complete...")
     print("(This can take 30-60 minutes. Press Ctrl+C to cancel.)")
@@ -319,10 +313,10 @@ def wait_for_report(credentials: dict, report_id: str, max_wait: int = 3600) ->
                 doc_res = report.get_report_document(
                     reportDocumentId=doc_id, download=False
                 )
-                url = doc_res.payload.get("url")
-                response = requests.get(url)
-                data = gzip.decompress(response.content).decode("utf-8")
-                error_data = json.loads(data)
+                error_data = download_report_document(
+                    doc_res.payload.get("url"),
+                    doc_res.payload.get("compressionAlgorithm"),
+                )
                 print(f"Error: {error_data.get('errorDetails', 'Unknown error')}")
             return False
         elif status == "CANCELLED":
@@ -9,20 +9,22 @@ Usage:
 """
 
 import argparse
-import gzip
-import json
+import heapq
 import sys
 import time
 from datetime import date, timedelta
+from functools import lru_cache
 
-import requests
 from decouple import config
 from sp_api.api import Reports
-from sp_api.base import Marketplaces
 
+from ..amazon.apis import get_reports_api
+from ..amazon.documents import download_report_document
 
+
+@lru_cache(maxsize=1)
 def get_credentials() -> dict:
-    """Load SP-API credentials from environment."""
+    """Load SP-API credentials from environment (cached; do not mutate)."""
     return {
         "refresh_token": config("SP_API_REFRESH_TOKEN"),
         "lwa_app_id": config("SP_API_CLIENT_ID"),
@@ -117,7 +119,7 @@ def test_connection(credentials: dict) -> bool:
     """Test the SP-API connection."""
     print("Testing SP-API connection...")
     try:
-        report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+        report = get_reports_api(credentials)
         report.get_reports(
             reportTypes=["GET_MERCHANT_LISTINGS_ALL_DATA"],
             pageSize=1,
@@ -131,7 +133,7 @@ def test_connection(credentials: dict) -> bool:
 
 def list_reports(credentials: dict) -> None:
     """List recent Sales and Traffic reports."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_api(credentials)
 
     print("Recent Sales and Traffic Reports:")
     print("-" * 80)
@@ -163,7 +165,7 @@ def request_report(
     asin_granularity: str = "CHILD",
 ) -> str:
     """Request a new Sales and Traffic report."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_api(credentials)
 
     print("Requesting Sales and Traffic report...")
     print(f"  Period: {start_date} to {end_date}")
@@ -193,7 +195,7 @@ def request_report(
 
 def check_report(credentials: dict, report_id: str) -> bool:
     """Check report status and download if ready."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_api(credentials)
 
     res = report.get_report(reportId=report_id)
     status = res.payload.get("processingStatus")
@@ -206,10 +208,10 @@ def check_report(credentials: dict, report_id: str) -> bool:
         return True
     elif status == "FATAL" and doc_id:
         doc_res = report.get_report_document(reportDocumentId=doc_id, download=False)
-        url = doc_res.payload.get("url")
-        response = requests.get(url)
-        data = gzip.decompress(response.content).decode("utf-8")
-        error_data = json.loads(data)
+        error_data = download_report_document(
+            doc_res.payload.get("url"),
+            doc_res.payload.get("compressionAlgorithm"),
+        )
         print(f"Error: {error_data.get('errorDetails', 'Unknown error')}")
         return False
     elif status in ("IN_QUEUE", "IN_PROGRESS"):
@@ -223,15 +225,9 @@ def check_report(credentials: dict, report_id: str) -> bool:
 def download_and_display(report: Reports, doc_id: str) -> None:
     """Download and display report data."""
     doc_res = report.get_report_document(reportDocumentId=doc_id, download=False)
-    url = doc_res.payload.get("url")
-
-    response = requests.get(url)
-    if doc_res.payload.get("compressionAlgorithm") == "GZIP":
-        data = gzip.decompress(response.content).decode("utf-8")
-    else:
-        data = response.text
-
-    report_data = json.loads(data)
+    report_data = download_report_document(
+        doc_res.payload.get("url"), doc_res.payload.get("compressionAlgorithm")
+    )
 
     if "errorDetails" in report_data:
         print(f"Error: {report_data['errorDetails']}")
@@ -285,13 +281,14 @@ def download_and_display(report: Reports, doc_id: str) -> None:
         )
         print("-" * 80)
 
-        # Sort by units ordered
-        sales_by_asin.sort(
+        # Top 20 by units ordered (partial heap instead of sorting every ASIN)
+        top_asins = heapq.nlargest(
+            20,
+            sales_by_asin,
             key=lambda x: x.get("salesByAsin", {}).get("unitsOrdered", 0),
-            reverse=True,
         )
 
-        for entry in sales_by_asin[:20]:  # Show top 20
+        for entry in top_asins:
             asin = entry.get("childAsin", entry.get("parentAsin", "N/A"))
             sku = entry.get("sku", "N/A")[:18]
             sales = entry.get("salesByAsin", {})
@@ -316,7 +313,7 @@ def download_and_display(report: Reports, doc_id: str) -> None:
 
 def wait_for_report(credentials: dict, report_id: str, max_wait: int = 1800) -> bool:
     """Wait for report to complete."""
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    report = get_reports_api(credentials)
 
     print(f"Waiting for report {report_id} to complete...")
     print("(Press Ctrl+C to cancel)")
@@ -342,10 +339,10 @@ def wait_for_report(credentials: dict, report_id: str, max_wait: int = 1800) ->
                 doc_res = report.get_report_document(
                     reportDocumentId=doc_id, download=False
                 )
-                url = doc_res.payload.get("url")
-                response = requests.get(url)
-                data = gzip.decompress(response.content).decode("utf-8")
-                error_data = json.loads(data)
+                error_data = download_report_document(
+                    doc_res.payload.get("url"),
+                    doc_res.payload.get("compressionAlgorithm"),
+                )
                 print(f"Error: {error_data.get('errorDetails', 'Unknown error')}")
             return False
         elif status == "CANCELLED":
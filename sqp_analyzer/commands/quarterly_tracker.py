@@ -14,18 +14,25 @@ Usage:
 """
 
 import argparse
-import gzip
-import json
+import heapq
+import random
 import sys
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from typing import Any
 
-import requests
-from sp_api.api import Reports
-from sp_api.base import Marketplaces
+from sp_api.base import SellingApiException, SellingApiRequestThrottledException
 
-from ..config import load_config, AppConfig, Thresholds
+from ..amazon.apis import get_reports_api
+from ..amazon.documents import download_report_document
+from ..amazon.ratelimit import TokenBucket
+from ..cache import load_cached_report, save_cached_report, set_report_cache_reads
+from ..config import load_config, get_fetch_concurrency, AppConfig, Thresholds
 from ..models import (
     SQPRecord,
     WeeklySnapshot,
@@ -35,7 +42,7 @@ from ..models import (
     DiagnosticType,
 )
 from ..sheets.client import SheetsClient
-from .fetch_listing import get_listing_content
+from .fetch_listing import get_listings_bulk
 
 
 # Constants
@@ -44,11 +51,31 @@ METRICS_PER_WEEK = 6  # Vol, Imp%, Clk%, Pur%, Opp, Rank
 STATIC_COLS = 5  # ASIN, Rank, Keyword, In Title, In Backend
 VOLUME_DROP_THRESHOLD = 0.30
 DASHBOARD_TAB_NAME = "Dashboard"
+REPORT_FINALIZATION_DAYS = 3  # Weeks ending more recently may still be revised
 RANK_SEVERITY = {"top_3": 3, "page_1_high": 2, "page_1_low": 1, "invisible": 0}
+DIAGNOSTIC_MULTIPLIERS = {
+    DiagnosticType.GHOST: 2.0,  # High priority - not ranking at all
+    DiagnosticType.WINDOW_SHOPPER: 1.5,  # Medium priority - not converting views
+    DiagnosticType.PRICE_PROBLEM: 1.3,  # Lower priority - may need pricing changes
+    DiagnosticType.HEALTHY: 0.5,  # Low priority - already performing
+}
 
+# Week cells written when the current week has no SQP record for a keyword,
+# and when an older week has no data in the existing row
+_NO_DATA_WEEK_CELLS = ("-", "-", "-", "-", "-", "invisible")
+_BLANK_WEEK_CELLS = ("", "", "", "", "", "")
 
+
+# SP-API Reports quotas (rate per second, burst), shared by all worker
+# threads so concurrent fetches stay under each operation's limit.
+_CREATE_REPORT_LIMITER = TokenBucket(rate=0.0167, capacity=15)
+_GET_REPORT_LIMITER = TokenBucket(rate=2.0, capacity=15)
+_GET_REPORT_DOCUMENT_LIMITER = TokenBucket(rate=0.0167, capacity=15)
+
+
+@lru_cache(maxsize=1)
 def get_credentials() -> dict:
-    """Load SP-API credentials from environment."""
+    """Load SP-API credentials from environment (cached; do not mutate)."""
     config = load_config()
     return {
         "refresh_token": config.sp_api.refresh_token,
@@ -57,15 +84,51 @@ def get_credentials() -> dict:
     }
 
 
+@lru_cache(maxsize=8)
+def _quarter_bounds(today_ordinal: int) -> tuple[int, int, int, date, date]:
+    """Quarter math for one day, shared by the date helpers below.
+
+    Keyed by date.toordinal() so each helper call is a cache hit after the
+    first on a given day.
+
+    Args:
+        today_ordinal: The day to compute for, as date.toordinal()
+
+    Returns:
+        Tuple of (quarter, year, week_in_quarter, first_sunday, last_saturday),
+        where first_sunday starts week 1 of the quarter and last_saturday ends
+        the last complete week
+    """
+    today = date.fromordinal(today_ordinal)
+    quarter = (today.month - 1) // 3 + 1
+
+    # First day of quarter
+    quarter_start_month = (quarter - 1) * 3 + 1
+    quarter_start = date(today.year, quarter_start_month, 1)
+
+    # Week number within the quarter (1-13)
+    days_since_start = (today - quarter_start).days
+    week_num = min(days_since_start // 7 + 1, 13)
+
+    # Week 1 starts on the first Sunday on or after the quarter's first day
+    first_sunday = quarter_start + timedelta(days=(6 - quarter_start.weekday()) % 7)
+
+    # Get last complete Saturday
+    # A Saturday's own week isn't complete yet, so step back a full week
+    days_since_saturday = (today.weekday() + 2) % 7 or 7
+    last_saturday = today - timedelta(days=days_since_saturday)
+
+    return quarter, today.year, week_num, first_sunday, last_saturday
+
+
 def get_current_quarter() -> tuple[int, int]:
     """Get current quarter (Q1-Q4) and year.
 
     Returns:
         Tuple of (quarter_number, year)
     """
-    today = date.today()
-    quarter = (today.month - 1) // 3 + 1
-    return quarter, today.year
+    quarter, year, _, _, _ = _quarter_bounds(date.today().toordinal())
+    return quarter, year
 
 
 def get_week_in_quarter() -> int:
@@ -74,17 +137,7 @@ def get_week_in_quarter() -> int:
     Returns:
         Week number (1-13)
     """
-    today = date.today()
-    quarter = (today.month - 1) // 3 + 1
-
-    # First day of quarter
-    quarter_start_month = (quarter - 1) * 3 + 1
-    quarter_start = date(today.year, quarter_start_month, 1)
-
-    # Calculate week number
-    days_since_start = (today - quarter_start).days
-    week_num = days_since_start // 7 + 1
-    return min(week_num, 13)
+    return _quarter_bounds(date.today().toordinal())[2]
 
 
 def get_consolidated_tab_name(quarter: int | None = None) -> str:
@@ -104,11 +157,7 @@ def get_consolidated_tab_name(quarter: int | None = None) -> str:
 
 def get_last_complete_week() -> tuple[date, date]:
     """Get the last complete week (Sunday to Saturday)."""
-    today = date.today()
-    days_since_saturday = (today.weekday() + 2) % 7
-    if days_since_saturday == 0:
-        days_since_saturday = 7
-    last_saturday = today - timedelta(days=days_since_saturday)
+    last_saturday = _quarter_bounds(date.today().toordinal())[4]
     last_sunday = last_saturday - timedelta(days=6)
     return last_sunday, last_saturday
 
@@ -119,65 +168,78 @@ def get_quarter_weeks() -> list[tuple[int, date, date]]:
     Returns:
         List of (week_num, start_date, end_date) tuples
     """
-    today = date.today()
-    quarter = (today.month - 1) // 3 + 1
-    year = today.year
-
-    # First day of quarter
-    quarter_start_month = (quarter - 1) * 3 + 1
-    quarter_start = date(year, quarter_start_month, 1)
-
-    # Find first Sunday of the quarter (or before if quarter starts mid-week)
-    days_to_sunday = (6 - quarter_start.weekday()) % 7
-    if days_to_sunday == 0 and quarter_start.weekday() != 6:
-        days_to_sunday = 7
-    first_sunday = quarter_start + timedelta(days=days_to_sunday)
-
-    # If quarter starts after Sunday, use the Sunday before
-    if first_sunday > quarter_start + timedelta(days=6):
-        first_sunday = first_sunday - timedelta(days=7)
-
-    # Get last complete Saturday
-    days_since_saturday = (today.weekday() + 2) % 7
-    if days_since_saturday == 0:
-        days_since_saturday = 7
-    last_saturday = today - timedelta(days=days_since_saturday)
+    _, _, _, first_sunday, last_saturday = _quarter_bounds(date.today().toordinal())
 
-    weeks = []
-    week_num = 1
-    current_sunday = first_sunday
+    # Complete Sunday-Saturday weeks from first_sunday through last_saturday
+    num_weeks = min(max(0, ((last_saturday - first_sunday).days + 1) // 7), 13)
+    return [
+        (
+            week_num,
+            first_sunday + timedelta(weeks=week_num - 1),
+            first_sunday + timedelta(weeks=week_num - 1, days=6),
+        )
+        for week_num in range(1, num_weeks + 1)
+    ]
 
-    while current_sunday + timedelta(days=6) <= last_saturday:
-        week_end = current_sunday + timedelta(days=6)
-        weeks.append((week_num, current_sunday, week_end))
-        current_sunday = current_sunday + timedelta(days=7)
-        week_num += 1
-        if week_num > 13:
-            break
 
-    return weeks
+def _retry_after_seconds(headers: Any) -> float | None:
+    """Parse a Retry-After header (seconds form), or None if absent/invalid."""
+    if not headers:
+        return None
+    try:
+        return float(headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
 
 
 def fetch_sqp_report(
-    credentials: dict, asin: str, start_date: date, end_date: date
+    credentials: dict,
+    asin: str,
+    start_date: date,
+    end_date: date,
+    initial_interval: float = 5.0,
+    max_interval: float = 60.0,
 ) -> dict | None:
     """Request and wait for SQP report.
 
+    Polls with exponential backoff: the first check comes after
+    initial_interval seconds, doubling up to max_interval, plus up to 2s of
+    jitter so concurrent polls don't line up. A throttled (429) status check
+    is retried on the same schedule, waiting at least its Retry-After.
+
     Args:
         credentials: SP-API credentials
         asin: ASIN to fetch data for
         start_date: Start date (must be Sunday)
         end_date: End date
+        initial_interval: Seconds to wait before the second status check
+        max_interval: Upper bound on the wait between status checks
+
+    Completed reports are cached on disk by (asin, start_date, end_date), so
+    rerunning a quarter skips SP-API for weeks already downloaded. Weeks that
+    ended within REPORT_FINALIZATION_DAYS are not cached, since Amazon may
+    still revise them, and neither are documents without dataByAsin entries.
 
     Returns:
         Report data dict or None if failed
     """
-    report = Reports(credentials=credentials, marketplace=Marketplaces.US)
+    # One line per event, tagged with the ASIN and period: this runs in
+    # worker threads, so consecutive prints from one call can interleave
+    # with other reports' output
+    label = f"{asin} {start_date}..{end_date}"
+
+    cache_key = f"sqp-{asin}-{start_date}-{end_date}"
+    cached = load_cached_report(cache_key)
+    if cached is not None:
+        print(f"  Using cached SQP report for {label}")
+        return cached
 
-    print(f"  Requesting SQP report for {asin}...")
-    print(f"  Period: {start_date} to {end_date}")
+    report = get_reports_api(credentials)
+
+    print(f"  Requesting SQP report for {label}")
 
     # Create report request
+    _CREATE_REPORT_LIMITER.acquire()
     res = report.create_report(
         reportType="GET_BRAND_ANALYTICS_SEARCH_QUERY_PERFORMANCE_REPORT",
         marketplaceIds=["ATVPDKIKX0DER"],
@@ -190,55 +252,87 @@ def fetch_sqp_report(
     )
 
     report_id = res.payload.get("reportId")
-    print(f"  Report ID: {report_id}")
-    print("  Waiting for report to complete...")
+    print(f"  Report {report_id} created for {label}, waiting...")
 
-    # Wait for completion (max 60 minutes)
+    # Wait for completion (max 60 minutes). The deadline is on the monotonic
+    # clock so wall-clock adjustments can't shorten or extend the wait.
     max_wait = 3600
-    start_time = time.time()
-    check_interval = 30
-
-    while time.time() - start_time < max_wait:
-        res = report.get_report(reportId=report_id)
-        status = res.payload.get("processingStatus")
-        doc_id = res.payload.get("reportDocumentId")
-
-        if status == "DONE" and doc_id:
-            # Download report
-            doc_res = report.get_report_document(
-                reportDocumentId=doc_id, download=False
-            )
-            url = doc_res.payload.get("url")
-
-            response = requests.get(url)
-            if doc_res.payload.get("compressionAlgorithm") == "GZIP":
-                data = gzip.decompress(response.content).decode("utf-8")
-            else:
-                data = response.text
+    start_time = time.monotonic()
+    deadline = start_time + max_wait
+    attempt = 0
+    last_status = None
 
-            return json.loads(data)
+    while time.monotonic() < deadline:
+        _GET_REPORT_LIMITER.acquire()
+        try:
+            res = report.get_report(reportId=report_id)
+        except SellingApiRequestThrottledException as e:
+            # 429: wait at least as long as asked, then keep polling
+            retry_after = _retry_after_seconds(e.headers)
+            print(f"  [WARNING] {label}: status check throttled, backing off")
+        else:
+            retry_after = None
+            status = res.payload.get("processingStatus")
+            doc_id = res.payload.get("reportDocumentId")
 
-        elif status == "FATAL":
-            if doc_id:
+            if status == "DONE" and doc_id:
+                # Download report
+                _GET_REPORT_DOCUMENT_LIMITER.acquire()
                 doc_res = report.get_report_document(
                     reportDocumentId=doc_id, download=False
                 )
-                url = doc_res.payload.get("url")
-                response = requests.get(url)
-                data = gzip.decompress(response.content).decode("utf-8")
-                error_data = json.loads(data)
-                print(f"  [ERROR] {error_data.get('errorDetails', 'Unknown error')}")
-            return None
-
-        elif status == "CANCELLED":
-            print("  [CANCELLED] Report was cancelled")
-            return None
-
-        elapsed = int(time.time() - start_time)
-        print(f"  [{elapsed // 60}m {elapsed % 60}s] Status: {status}")
-        time.sleep(check_interval)
+                report_data = download_report_document(
+                    doc_res.payload.get("url"),
+                    doc_res.payload.get("compressionAlgorithm"),
+                )
+                # Cache only finalized weeks with data; an empty or error
+                # document would otherwise be replayed on every later run
+                finalized = date.today() - timedelta(days=REPORT_FINALIZATION_DAYS)
+                has_data = "errorDetails" not in report_data and report_data.get(
+                    "dataByAsin"
+                )
+                if end_date < finalized and has_data:
+                    save_cached_report(cache_key, report_data)
+                return report_data
+
+            elif status == "FATAL":
+                if doc_id:
+                    _GET_REPORT_DOCUMENT_LIMITER.acquire()
+                    doc_res = report.get_report_document(
+                        reportDocumentId=doc_id, download=False
+                    )
+                    error_data = download_report_document(
+                        doc_res.payload.get("url"),
+                        doc_res.payload.get("compressionAlgorithm"),
+                    )
+                    print(
+                        f"  [ERROR] {label}: "
+                        f"{error_data.get('errorDetails', 'Unknown error')}"
+                    )
+                return None
+
+            elif status == "CANCELLED":
+                print(f"  [CANCELLED] Report for {label} was cancelled")
+                return None
+
+            # Only report status transitions, not every poll
+            if status != last_status:
+                elapsed = int(time.monotonic() - start_time)
+                print(f"  [{elapsed // 60}m {elapsed % 60}s] {label}: {status}")
+                last_status = status
+
+        interval = min(max_interval, initial_interval * 2**attempt)
+        interval += random.uniform(0, 2)
+        if retry_after is not None:
+            interval = max(interval, retry_after)
+        attempt += 1
+        # Don't sleep past the deadline; poll once more right at it instead
+        time.sleep(max(0.0, min(interval, deadline - time.monotonic())))
 
-    print(f"  [TIMEOUT] Report did not complete within {max_wait // 60} minutes")
+    print(
+        f"  [TIMEOUT] Report for {label} did not complete within "
+        f"{max_wait // 60} minutes"
+    )
     return None
 
 
@@ -264,30 +358,34 @@ def parse_report_to_snapshot(report_data: dict) -> WeeklySnapshot | None:
     first_asin = entries[0].get("asin", "UNKNOWN")
 
     records = []
+    append = records.append
     for entry in entries:
-        asin = entry.get("asin", first_asin)
-        sq = entry.get("searchQueryData", {})
-        imp = entry.get("impressionData", {})
-        clk = entry.get("clickData", {})
-        pur = entry.get("purchaseData", {})
-
-        record = SQPRecord(
-            search_query=sq.get("searchQuery", "") or "",
-            asin=asin,
-            week_date=week_date,
-            search_volume=sq.get("searchQueryVolume", 0) or 0,
-            search_score=sq.get("searchQueryScore", 0) or 0,
-            impressions_total=imp.get("totalImpressions", 0) or 0,
-            impressions_asin=imp.get("asinImpressions", 0) or 0,
-            impressions_share=imp.get("asinImpressionShare", 0) or 0,
-            clicks_total=clk.get("totalClicks", 0) or 0,
-            clicks_asin=clk.get("asinClicks", 0) or 0,
-            clicks_share=clk.get("asinClickShare", 0) or 0,
-            purchases_total=pur.get("totalPurchases", 0) or 0,
-            purchases_asin=pur.get("asinPurchases", 0) or 0,
-            purchases_share=pur.get("asinPurchaseShare", 0) or 0,
+        # Bind each section's .get once; "or 0" also maps explicit nulls to 0
+        get = entry.get
+        sq = (get("searchQueryData") or {}).get
+        imp = (get("impressionData") or {}).get
+        clk = (get("clickData") or {}).get
+        pur = (get("purchaseData") or {}).get
+
+        append(
+            SQPRecord(
+                # Interned: the same terms recur across every week of the quarter
+                search_query=sys.intern(sq("searchQuery") or ""),
+                asin=get("asin", first_asin),
+                week_date=week_date,
+                search_volume=sq("searchQueryVolume") or 0,
+                search_score=sq("searchQueryScore") or 0,
+                impressions_total=imp("totalImpressions") or 0,
+                impressions_asin=imp("asinImpressions") or 0,
+                impressions_share=imp("asinImpressionShare") or 0,
+                clicks_total=clk("totalClicks") or 0,
+                clicks_asin=clk("asinClicks") or 0,
+                clicks_share=clk("asinClickShare") or 0,
+                purchases_total=pur("totalPurchases") or 0,
+                purchases_asin=pur("asinPurchases") or 0,
+                purchases_share=pur("asinPurchaseShare") or 0,
+            )
         )
-        records.append(record)
 
     return WeeklySnapshot(
         asin=first_asin,
@@ -344,14 +442,7 @@ def calculate_opportunity_score(record: SQPRecord, diagnostic: DiagnosticType) -
     volume_score = min(record.search_volume / 10000, 1.0) * 40
 
     # Multiplier based on diagnostic type
-    diagnostic_multiplier = {
-        DiagnosticType.GHOST: 2.0,  # High priority - not ranking at all
-        DiagnosticType.WINDOW_SHOPPER: 1.5,  # Medium priority - not converting views
-        DiagnosticType.PRICE_PROBLEM: 1.3,  # Lower priority - may need pricing changes
-        DiagnosticType.HEALTHY: 0.5,  # Low priority - already performing
-    }
-
-    multiplier = diagnostic_multiplier.get(diagnostic, 1.0)
+    multiplier = DIAGNOSTIC_MULTIPLIERS.get(diagnostic, 1.0)
 
     # Penalty for already having high market share
     share_penalty = record.purchases_share * 0.5
@@ -372,13 +463,13 @@ def get_top_keywords(
     Returns:
         List of top SQPRecords sorted by search volume
     """
-    # Filter to keywords with at least some purchase share
-    with_purchases = [r for r in snapshot.records if r.purchases_share > 0]
-
-    # Sort by volume (descending)
-    sorted_records = sorted(with_purchases, key=lambda r: r.search_volume, reverse=True)
-
-    return sorted_records[:count]
+    # Keywords with at least some purchase share, top N by volume (descending).
+    # nlargest keeps a heap of size count instead of sorting every record.
+    return heapq.nlargest(
+        count,
+        (r for r in snapshot.records if r.purchases_share > 0),
+        key=attrgetter("search_volume"),
+    )
 
 
 def build_headers(weeks: list[str]) -> list[str]:
@@ -445,27 +536,32 @@ def parse_consolidated_sheet(
     if len(all_values) < 2:
         return {}
 
-    headers = all_values[0]
-    data_rows = all_values[1:]
+    num_cols = len(all_values[0])
 
     result: dict[str, dict[str, Any]] = {}
-    current_asin = None
+    # Append targets for the current ASIN block; None until the first separator
+    add_keyword = None
+    add_raw_row = None
 
-    for row in data_rows:
-        # Pad row to header length
-        padded = row + [""] * (len(headers) - len(row))
+    for row in islice(all_values, 1, None):
+        # Pad short rows to header length; full-width rows are used as-is
+        row_len = len(row)
+        padded = row if row_len >= num_cols else row + [""] * (num_cols - row_len)
 
         if is_asin_separator_row(padded):
-            current_asin = padded[0]
-            result[current_asin] = {
+            keywords: list[dict[str, Any]] = []
+            raw_rows = [padded]  # Include separator
+            result[padded[0]] = {
                 "name": padded[2],
-                "keywords": [],
-                "raw_rows": [padded],  # Include separator
+                "keywords": keywords,
+                "raw_rows": raw_rows,
             }
-        elif current_asin and current_asin in result:
+            add_keyword = keywords.append
+            add_raw_row = raw_rows.append
+        elif add_keyword is not None:
             # Data row: col 0 = ASIN, col 1 = Rank, col 2 = Keyword,
             # col 3 = In Title, col 4 = In Backend
-            result[current_asin]["keywords"].append(
+            add_keyword(
                 {
                     "rank": padded[1],
                     "keyword": padded[2],
@@ -474,11 +570,25 @@ def parse_consolidated_sheet(
                     "row_data": padded,
                 }
             )
-            result[current_asin]["raw_rows"].append(padded)
+            add_raw_row(padded)
 
     return result
 
 
+def _to_float(val: Any) -> float | None:
+    """Convert a sheet cell to float, or None for blank/'-'/non-numeric."""
+    # Rows written in this run hold real numbers; only sheet reads are strings
+    if isinstance(val, (int, float)):
+        return float(val)
+    s = str(val).strip()
+    if s in ("", "-"):
+        return None
+    try:
+        return float(s)
+    except ValueError:
+        return None
+
+
 def extract_week_metrics(row_data: list, week_index: int) -> dict[str, Any] | None:
     """Extract 6 metric values for a given week from a raw row.
 
@@ -496,39 +606,56 @@ def extract_week_metrics(row_data: list, week_index: int) -> dict[str, Any] | No
     if end > len(row_data):
         return None
 
-    raw = row_data[start:end]
-
-    # Skip if all values are empty or dashes
-    if all(str(v).strip() in ("", "-") for v in raw):
-        return None
-
-    def to_float(val: Any) -> float | None:
-        s = str(val).strip()
-        if s in ("", "-"):
-            return None
-        try:
-            return float(s)
-        except ValueError:
-            return None
+    vol, imp, clk, pur, opp, rank = row_data[start:end]
 
-    volume = to_float(raw[0])
+    # A week without a volume (blank, '-' or all-empty) has no usable data
+    volume = _to_float(vol)
     if volume is None:
         return None
 
     return {
         "volume": volume,
-        "imp_share": to_float(raw[1]),
-        "click_share": to_float(raw[2]),
-        "purchase_share": to_float(raw[3]),
-        "opportunity_score": to_float(raw[4]),
-        "rank_status": str(raw[5]).strip() if raw[5] else None,
+        "imp_share": _to_float(imp),
+        "click_share": _to_float(clk),
+        "purchase_share": _to_float(pur),
+        "opportunity_score": _to_float(opp),
+        "rank_status": str(rank).strip() if rank else None,
     }
 
 
+# (current, previous) extract_week_metrics results per keyword of one ASIN
+WeekMetrics = list[tuple[dict[str, Any] | None, dict[str, Any] | None]]
+
+
+def _latest_week_metrics(asin_data: dict[str, Any], num_weeks: int) -> WeekMetrics:
+    """Get (current, previous) week metrics for each keyword of one ASIN.
+
+    build_dashboard computes this once per ASIN and hands it to both
+    detect_drastic_changes and build_asin_summary, so each row is parsed once.
+
+    Args:
+        asin_data: Parsed ASIN data from parse_consolidated_sheet
+        num_weeks: Number of weeks in the tracker
+
+    Returns:
+        One (current, previous) pair per keyword, in asin_data["keywords"]
+        order; each is an extract_week_metrics result, or None where the week
+        is missing or empty
+    """
+    week_metrics: WeekMetrics = []
+    for kw_info in asin_data["keywords"]:
+        row = kw_info["row_data"]
+        curr = extract_week_metrics(row, num_weeks - 1) if num_weeks >= 1 else None
+        prev = extract_week_metrics(row, num_weeks - 2) if num_weeks >= 2 else None
+        week_metrics.append((curr, prev))
+    return week_metrics
+
+
 def detect_drastic_changes(
     asin: str,
     asin_data: dict[str, Any],
     num_weeks: int,
+    week_metrics: WeekMetrics | None = None,
 ) -> list[dict[str, Any]]:
     """Scan all keywords for one ASIN, return flagged entries with reasons.
 
@@ -539,23 +666,26 @@ def detect_drastic_changes(
         asin: The ASIN identifier
         asin_data: Parsed ASIN data from parse_consolidated_sheet
         num_weeks: Number of weeks in the tracker
+        week_metrics: Precomputed _latest_week_metrics(asin_data, num_weeks);
+            computed here when omitted
 
     Returns:
         List of dicts with: keyword, rank, reasons (list[str]),
         curr_vol, curr_rank, prev_vol, prev_rank
     """
     flagged = []
+    if week_metrics is None:
+        week_metrics = _latest_week_metrics(asin_data, num_weeks)
 
-    for kw_info in asin_data["keywords"]:
+    for kw_info, (curr_metrics, prev_metrics) in zip(
+        asin_data["keywords"], week_metrics
+    ):
         row = kw_info["row_data"]
         reasons: list[str] = []
 
-        curr_metrics = None
-        prev_metrics = None
-
-        if num_weeks >= 2:
-            curr_metrics = extract_week_metrics(row, num_weeks - 1)
-            prev_metrics = extract_week_metrics(row, num_weeks - 2)
+        # Changes need two weeks to compare
+        if num_weeks < 2:
+            curr_metrics = prev_metrics = None
 
         curr_vol = curr_metrics["volume"] if curr_metrics else None
         prev_vol = prev_metrics["volume"] if prev_metrics else None
@@ -609,6 +739,7 @@ def build_asin_summary(
     asin_data: dict[str, Any],
     num_weeks: int,
     flagged_keywords: list[dict[str, Any]],
+    week_metrics: WeekMetrics | None = None,
 ) -> list[Any]:
     """Produce one summary row for the ASIN summary section.
 
@@ -620,6 +751,8 @@ def build_asin_summary(
         asin_data: Parsed ASIN data
         num_weeks: Number of weeks in the tracker
         flagged_keywords: List of flagged keyword dicts from detect_drastic_changes
+        week_metrics: Precomputed _latest_week_metrics(asin_data, num_weeks);
+            computed here when omitted
 
     Returns:
         Row: [ASIN, Product Name, # Top 3, # Page 1 High, # Page 1 Low,
@@ -627,15 +760,12 @@ def build_asin_summary(
     """
     counts = {"top_3": 0, "page_1_high": 0, "page_1_low": 0, "invisible": 0}
     total_kw = len(asin_data["keywords"])
+    if week_metrics is None:
+        week_metrics = _latest_week_metrics(asin_data, num_weeks)
 
-    for kw_info in asin_data["keywords"]:
-        row = kw_info["row_data"]
-        if num_weeks >= 1:
-            metrics = extract_week_metrics(row, num_weeks - 1)
-            if metrics and metrics["rank_status"] in counts:
-                counts[metrics["rank_status"]] += 1
-            else:
-                counts["invisible"] += 1
+    for metrics, _ in week_metrics:
+        if metrics and metrics["rank_status"] in counts:
+            counts[metrics["rank_status"]] += 1
         else:
             counts["invisible"] += 1
 
@@ -705,8 +835,11 @@ def build_dashboard(
     flagged_rows: list[list[Any]] = []
 
     for asin, asin_data in quarter_data.items():
-        flagged = detect_drastic_changes(asin, asin_data, num_weeks)
-        summary_row = build_asin_summary(asin, asin_data, num_weeks, flagged)
+        week_metrics = _latest_week_metrics(asin_data, num_weeks)
+        flagged = detect_drastic_changes(asin, asin_data, num_weeks, week_metrics)
+        summary_row = build_asin_summary(
+            asin, asin_data, num_weeks, flagged, week_metrics
+        )
         summary_rows.append(summary_row)
 
         for f in flagged:
@@ -743,7 +876,8 @@ def generate_dashboard(sheets: SheetsClient, tab_name: str) -> None:
         print("[INFO] No ASIN data parsed, skipping dashboard generation")
         return
 
-    # Determine number of weeks from headers
+    # Determine number of weeks from the "{week} Vol" header labels, so
+    # trailing blank or hand-added columns don't shift the count
     headers = all_values[0]
     week_count = sum(1 for h in headers if h.endswith(" Vol"))
 
@@ -776,6 +910,8 @@ def check_keyword_alerts(
 ) -> list[str]:
     """Check for alerts when keyword drops from title/backend.
 
+    Single-keyword form of check_keyword_alerts_bulk.
+
     Args:
         keyword: The keyword to check
         current_listing: Current listing content
@@ -785,20 +921,40 @@ def check_keyword_alerts(
     Returns:
         List of alert messages
     """
-    alerts = []
+    placement = check_keyword_alerts_bulk(
+        current_listing, {keyword: (previous_in_title, previous_in_backend)}
+    )
+    return placement[keyword][2] if placement else []
 
-    if current_listing is None:
-        return alerts
 
-    in_title, in_backend = current_listing.contains_keyword(keyword)
+def check_keyword_alerts_bulk(
+    current_listing: ListingContent | None,
+    previous_placement: dict[str, tuple[bool, bool]],
+) -> dict[str, tuple[bool, bool, list[str]]]:
+    """Check placement and drop alerts for all of one listing's keywords.
 
-    if previous_in_title and not in_title:
-        alerts.append("DROPPED FROM TITLE")
+    Args:
+        current_listing: Current listing content
+        previous_placement: Map of keyword -> (was in title, was in backend)
 
-    if previous_in_backend and not in_backend:
-        alerts.append("DROPPED FROM BACKEND")
+    Returns:
+        Map of keyword -> (in title, in backend, alert messages) for every
+        keyword, or an empty map if there is no listing
+    """
+    if current_listing is None:
+        return {}
 
-    return alerts
+    results: dict[str, tuple[bool, bool, list[str]]] = {}
+    contains_keyword = current_listing.contains_keyword
+    for keyword, (previous_in_title, previous_in_backend) in previous_placement.items():
+        in_title, in_backend = contains_keyword(keyword)
+        alerts = []
+        if previous_in_title and not in_title:
+            alerts.append("DROPPED FROM TITLE")
+        if previous_in_backend and not in_backend:
+            alerts.append("DROPPED FROM BACKEND")
+        results[keyword] = (in_title, in_backend, alerts)
+    return results
 
 
 def _build_asin_keywords(
@@ -833,11 +989,17 @@ def _build_asin_keywords(
     if not top_keywords:
         return []
 
+    # Index each week once so keyword lookups are O(1) instead of a scan
+    records_by_week = {
+        label: snapshot.get_records_by_lower_query()
+        for label, snapshot in weekly_snapshots.items()
+    }
+
     quarterly_keywords: list[QuarterlyKeyword] = []
 
     for rank, latest_record in enumerate(top_keywords, 1):
         keyword = latest_record.search_query
-        keyword_lower = keyword.lower()
+        keyword_lower = latest_record.search_query_lower
 
         # Check keyword placement
         in_title = False
@@ -848,13 +1010,8 @@ def _build_asin_keywords(
         # Gather metrics for all weeks
         weekly_metrics = {}
         for week_label in week_labels:
-            if week_label in weekly_snapshots:
-                snapshot = weekly_snapshots[week_label]
-                record = None
-                for r in snapshot.records:
-                    if r.search_query.lower() == keyword_lower:
-                        record = r
-                        break
+            if week_label in records_by_week:
+                record = records_by_week[week_label].get(keyword_lower)
 
                 if record:
                     diagnostic = get_diagnostic_type(record, config.thresholds)
@@ -904,6 +1061,90 @@ def _build_asin_keywords(
     return quarterly_keywords
 
 
+def _fetch_asin_snapshots(
+    credentials: dict,
+    asin: str,
+    quarter_weeks: list[tuple[int, date, date]],
+) -> dict[str, WeeklySnapshot]:
+    """Fetch and parse the SQP report for each quarter week of one ASIN.
+
+    Weeks are fetched concurrently (up to SQP_WEEK_WORKERS); report creation
+    is throttled by the shared create_report limiter, so this is safe to run
+    from several worker threads at once.
+
+    Args:
+        credentials: SP-API credentials
+        asin: ASIN to fetch
+        quarter_weeks: (week_num, start_date, end_date) tuples
+
+    Returns:
+        Snapshots keyed by week label (e.g., 'W01'); failed weeks, including
+        ones that raised an SP-API error, are omitted
+    """
+    weekly_snapshots: dict[str, WeeklySnapshot] = {}
+    if not quarter_weeks:
+        return weekly_snapshots
+
+    def fetch_week(week: tuple[int, date, date]) -> dict | None:
+        week_num, start_date, end_date = week
+        print(f"  Fetching {asin} W{week_num:02d} ({start_date} to {end_date})")
+        # One failed week must not discard the others
+        try:
+            return fetch_sqp_report(credentials, asin, start_date, end_date)
+        except SellingApiException as e:
+            print(f"    [ERROR] SP-API error for {asin} W{week_num:02d}: {e}")
+            return None
+
+    with ThreadPoolExecutor(
+        max_workers=min(get_fetch_concurrency()[1], len(quarter_weeks))
+    ) as pool:
+        reports = list(pool.map(fetch_week, quarter_weeks))
+
+    for (week_num, _, _), report_data in zip(quarter_weeks, reports):
+        week_label = f"W{week_num:02d}"
+        if not report_data:
+            print(f"    [WARNING] Could not fetch {asin} {week_label} data")
+            continue
+
+        snapshot = parse_report_to_snapshot(report_data)
+        if snapshot:
+            weekly_snapshots[week_label] = snapshot
+            print(
+                f"    Loaded {len(snapshot.records)} keywords for {asin} {week_label}"
+            )
+        else:
+            print(f"    [WARNING] Could not parse {asin} {week_label} data")
+
+    return weekly_snapshots
+
+
+def _fetch_listings(
+    config: AppConfig, asin_infos: list[dict[str, Any]]
+) -> dict[str, ListingContent | None]:
+    """Fetch listing content for several ASINs in batched Listings API calls.
+
+    Args:
+        config: App configuration (seller ID)
+        asin_infos: ASIN dicts from the master sheet (asin, sku, ...)
+
+    Returns:
+        Map of ASIN -> ListingContent (None if the lookup failed); ASINs
+        without a SKU, or all ASINs when no seller ID is configured, are omitted
+    """
+    seller_id = config.sp_api.seller_id
+    if not seller_id:
+        return {}
+
+    sku_by_asin = {a["asin"]: a["sku"] for a in asin_infos if a.get("sku")}
+    # Look each SKU up once even if several ASIN rows share it
+    skus = list(dict.fromkeys(sku_by_asin.values()))
+    if not skus:
+        return {}
+
+    by_sku = get_listings_bulk(seller_id, skus)
+    return {asin: by_sku.get(sku) for asin, sku in sku_by_asin.items()}
+
+
 def start_quarter(config: AppConfig) -> bool:
     """Initialize consolidated quarterly tracker with all active ASINs.
 
@@ -951,42 +1192,38 @@ def start_quarter(config: AppConfig) -> bool:
     num_cols = len(headers)
     all_rows: list[list] = []
 
-    for asin_info in asin_list:
+    # Report fetches are I/O bound (create, poll, download), so run ASINs
+    # concurrently; map() returns results in asin_list order.
+    with ThreadPoolExecutor(
+        max_workers=min(get_fetch_concurrency()[0], len(asin_list))
+    ) as pool:
+        asin_snapshots = list(
+            pool.map(
+                lambda info: _fetch_asin_snapshots(
+                    credentials, info["asin"], quarter_weeks
+                ),
+                asin_list,
+            )
+        )
+
+    # Listing lookups only matter for ASINs that returned SQP data
+    listings = _fetch_listings(
+        config, [a for a, snaps in zip(asin_list, asin_snapshots) if snaps]
+    )
+
+    for asin_info, weekly_snapshots in zip(asin_list, asin_snapshots):
         asin = asin_info["asin"]
-        sku = asin_info.get("sku", "")
         product_name = asin_info.get("name", "")
 
         print(f"\n--- Processing {asin} ({product_name}) ---")
 
-        # Fetch SQP data for all weeks
-        weekly_snapshots: dict[str, WeeklySnapshot] = {}
-        for week_num, start_date, end_date in quarter_weeks:
-            week_label = f"W{week_num:02d}"
-            print(f"  Fetching {week_label} ({start_date} to {end_date})")
-
-            report_data = fetch_sqp_report(credentials, asin, start_date, end_date)
-            if report_data:
-                snapshot = parse_report_to_snapshot(report_data)
-                if snapshot:
-                    weekly_snapshots[week_label] = snapshot
-                    print(f"    Loaded {len(snapshot.records)} keywords")
-                else:
-                    print(f"    [WARNING] Could not parse {week_label} data")
-            else:
-                print(f"    [WARNING] Could not fetch {week_label} data")
-
         if not weekly_snapshots:
             print(f"  [WARNING] No SQP data for {asin}, skipping")
             continue
 
-        # Fetch listing content
-        listing = None
-        if sku and config.sp_api.seller_id:
-            listing = get_listing_content(config.sp_api.seller_id, sku)
-
         # Build keywords for this ASIN
         quarterly_keywords = _build_asin_keywords(
-            asin, weekly_snapshots, week_labels, listing, config
+            asin, weekly_snapshots, week_labels, listings.get(asin), config
         )
 
         if not quarterly_keywords:
@@ -1023,15 +1260,63 @@ def start_quarter(config: AppConfig) -> bool:
     return True
 
 
-def update_week(config: AppConfig) -> bool:
+def _fetch_update_reports(
+    credentials: dict,
+    asin_list: list[dict[str, Any]],
+    existing_asins: dict[str, dict[str, Any]],
+    quarter_weeks: list[tuple[int, date, date]],
+) -> list[WeeklySnapshot | dict[str, WeeklySnapshot] | None]:
+    """Fetch SQP data for a weekly update, running ASINs concurrently.
+
+    ASINs already in the tracker need only the last complete week (the last
+    of quarter_weeks); new ASINs need every week of the quarter so far.
+
+    Args:
+        credentials: SP-API credentials
+        asin_list: Active ASIN dicts from the master sheet
+        existing_asins: Parsed tracker data from parse_consolidated_sheet
+        quarter_weeks: (week_num, start_date, end_date) tuples from
+            get_quarter_weeks, ending with the week being updated
+
+    Returns:
+        One entry per ASIN in asin_list order: the current week's snapshot
+        (or None) for existing ASINs, or a week label -> snapshot map for new ones
+    """
+    if not asin_list:
+        return []
+
+    _, start_date, end_date = quarter_weeks[-1]
+
+    def fetch(asin_info: dict[str, Any]):
+        asin = asin_info["asin"]
+        if asin in existing_asins:
+            try:
+                report_data = fetch_sqp_report(credentials, asin, start_date, end_date)
+            except SellingApiException as e:
+                print(f"  [ERROR] SP-API error for {asin}: {e}")
+                return None
+            return parse_report_to_snapshot(report_data) if report_data else None
+        return _fetch_asin_snapshots(credentials, asin, quarter_weeks)
+
+    with ThreadPoolExecutor(
+        max_workers=min(get_fetch_concurrency()[0], len(asin_list))
+    ) as pool:
+        return list(pool.map(fetch, asin_list))
+
+
+def update_week(config: AppConfig, force: bool = False) -> bool:
     """Update consolidated quarterly tracker with new week's metrics.
 
     Reads the existing consolidated sheet, fetches new data for all active ASINs,
     and rebuilds the sheet. New ASINs get full initialization; existing ASINs
-    get the current week merged in.
+    get the current week merged in. The current week is the last complete
+    Sunday-Saturday week, labelled by its position in the quarter as in
+    start_quarter. If the sheet already has that week (a re-run), existing
+    ASINs keep their rows as-is and are not fetched.
 
     Args:
         config: App configuration
+        force: Refetch the current week even if the sheet already has it
 
     Returns:
         True if successful
@@ -1039,8 +1324,18 @@ def update_week(config: AppConfig) -> bool:
     credentials = get_credentials()
     quarter, year = get_current_quarter()
     tab_name = get_consolidated_tab_name(quarter)
-    week_num = get_week_in_quarter()
-    week_label = f"W{week_num:02d}"
+
+    # Label the week by the period actually fetched, so the same label always
+    # holds the same Sunday-Saturday data across runs
+    quarter_weeks = get_quarter_weeks()
+    last_week = get_last_complete_week()
+    if not quarter_weeks or quarter_weeks[-1][1:] != last_week:
+        print(
+            f"[ERROR] Last complete week ({last_week[0]} to {last_week[1]}) "
+            f"is not in Q{quarter} {year} yet"
+        )
+        return False
+    week_label = f"W{quarter_weeks[-1][0]:02d}"
 
     print(f"\n{'=' * 60}")
     print(f"Updating Q{quarter} {year} consolidated tracker")
@@ -1066,53 +1361,62 @@ def update_week(config: AppConfig) -> bool:
     headers = existing_data[0]
     existing_asins = parse_consolidated_sheet(existing_data)
 
-    # Determine existing weeks from headers
-    existing_weeks = []
-    for h in headers:
+    # Existing weeks from the "{week} Vol" headers, each mapped to its old
+    # column (first occurrence) for carrying existing data forward
+    vol_col: dict[str, int] = {}
+    for i, h in enumerate(headers):
         if h.endswith(" Vol"):
-            week = h.replace(" Vol", "")
-            if week not in existing_weeks:
-                existing_weeks.append(week)
+            vol_col.setdefault(h[: -len(" Vol")], i)
 
     # Add current week if not present
-    all_weeks = existing_weeks.copy()
-    if week_label not in all_weeks:
-        all_weeks.append(week_label)
-    all_weeks.sort()
+    all_weeks = sorted(vol_col.keys() | {week_label})
+    # Per week in output order: (is the current week, old "Vol" column)
+    week_sources = [(week == week_label, vol_col.get(week)) for week in all_weeks]
+    thresholds = config.thresholds
 
     # Build new headers and all rows
     new_headers = build_headers(all_weeks)
     num_cols = len(new_headers)
     all_rows: list[list] = []
     alerts_found: list[tuple[str, str, str]] = []  # (asin, keyword, alert)
+    alerts_by_kw: defaultdict[tuple[str, str], list[str]] = defaultdict(list)
+
+    # On a re-run for a week the sheet already has, existing ASINs' rows are
+    # already current; only new ASINs need fetching
+    reuse_existing = week_label in vol_col and not force
+    to_fetch = [
+        a for a in asin_list if not (reuse_existing and a["asin"] in existing_asins)
+    ]
+
+    listings = _fetch_listings(config, to_fetch)
+    asin_reports = dict(
+        zip(
+            (a["asin"] for a in to_fetch),
+            _fetch_update_reports(credentials, to_fetch, existing_asins, quarter_weeks),
+        )
+    )
 
     for asin_info in asin_list:
         asin = asin_info["asin"]
-        sku = asin_info.get("sku", "")
         product_name = asin_info.get("name", "")
+        listing = listings.get(asin)
+        fetched = asin_reports.get(asin)
 
         print(f"\n--- Processing {asin} ({product_name}) ---")
 
-        if asin in existing_asins:
+        if reuse_existing and asin in existing_asins:
+            print(
+                f"  {week_label} already in tracker, keeping existing rows "
+                "(--force to refetch)"
+            )
+            all_rows.extend(existing_asins[asin]["raw_rows"])
+
+        elif asin in existing_asins:
             # UPDATE PATH: ASIN exists in sheet, merge new week data
             print(f"  Updating existing ASIN with {week_label} data")
 
-            # Fetch current week's SQP data
-            start_date, end_date = get_last_complete_week()
-            report_data = fetch_sqp_report(credentials, asin, start_date, end_date)
-
-            snapshot = None
-            if report_data:
-                snapshot = parse_report_to_snapshot(report_data)
-
-            current_data = {}
-            if snapshot:
-                current_data = {r.search_query.lower(): r for r in snapshot.records}
-
-            # Fetch listing content
-            listing = None
-            if sku and config.sp_api.seller_id:
-                listing = get_listing_content(config.sp_api.seller_id, sku)
+            snapshot = fetched
+            current_data = snapshot.get_records_by_lower_query() if snapshot else {}
 
             # Rebuild rows for this ASIN
             asin_data = existing_asins[asin]
@@ -1122,25 +1426,30 @@ def update_week(config: AppConfig) -> bool:
                 )
             )
 
+            placements = check_keyword_alerts_bulk(
+                listing,
+                {
+                    kw_info["keyword"]: (kw_info["in_title"], kw_info["in_backend"])
+                    for kw_info in asin_data["keywords"]
+                },
+            )
+
             for kw_info in asin_data["keywords"]:
                 keyword = kw_info["keyword"]
                 keyword_lower = keyword.lower()
                 record = current_data.get(keyword_lower)
                 old_row = kw_info["row_data"]
 
-                # Check keyword placement
+                # Keyword placement from the listing, or last week's if unknown
                 current_in_title = kw_info["in_title"]
                 current_in_backend = kw_info["in_backend"]
 
-                if listing:
-                    current_in_title, current_in_backend = listing.contains_keyword(
-                        keyword
-                    )
-                    alerts = check_keyword_alerts(
-                        keyword, listing, kw_info["in_title"], kw_info["in_backend"]
-                    )
+                placement = placements.get(keyword)
+                if placement:
+                    current_in_title, current_in_backend, alerts = placement
                     if alerts:
                         alerts_found.extend((asin, keyword, a) for a in alerts)
+                        alerts_by_kw[(asin, keyword)].extend(alerts)
 
                 # Build new row
                 row = [
@@ -1151,46 +1460,33 @@ def update_week(config: AppConfig) -> bool:
                     "YES" if current_in_backend else "NO",
                 ]
 
+                # Current week's cells are computed once per keyword; other
+                # weeks are carried over from the old row
+                if record:
+                    diagnostic = get_diagnostic_type(record, thresholds)
+                    current_cells = (
+                        record.search_volume,
+                        round(record.impressions_share, 1),
+                        round(record.clicks_share, 1),
+                        round(record.purchases_share, 1),
+                        calculate_opportunity_score(record, diagnostic),
+                        get_rank_status(record.impressions_share, thresholds).value,
+                    )
+                else:
+                    current_cells = _NO_DATA_WEEK_CELLS
+
                 # Add metrics for each week
-                for week in all_weeks:
-                    if week == week_label and record:
-                        diagnostic = get_diagnostic_type(record, config.thresholds)
-                        opp_score = calculate_opportunity_score(record, diagnostic)
-                        rank_status = get_rank_status(
-                            record.impressions_share, config.thresholds
-                        )
-                        row.extend(
-                            [
-                                record.search_volume,
-                                round(record.impressions_share, 1),
-                                round(record.clicks_share, 1),
-                                round(record.purchases_share, 1),
-                                opp_score,
-                                rank_status.value,
-                            ]
-                        )
-                    elif week == week_label:
-                        row.extend(["-", "-", "-", "-", "-", "invisible"])
+                old_len = len(old_row)
+                for is_current, col in week_sources:
+                    if is_current:
+                        row += current_cells
+                    elif col is not None and col + METRICS_PER_WEEK <= old_len:
+                        row += old_row[col : col + METRICS_PER_WEEK]
                     else:
-                        # Preserve existing data from old row
-                        week_start_idx = None
-                        for i, h in enumerate(headers):
-                            if h == f"{week} Vol":
-                                week_start_idx = i
-                                break
-
-                        if week_start_idx is not None and week_start_idx + 6 <= len(
-                            old_row
-                        ):
-                            row.extend(old_row[week_start_idx : week_start_idx + 6])
-                        else:
-                            row.extend(["", "", "", "", "", ""])
+                        row += _BLANK_WEEK_CELLS
 
                 # Add alerts
-                kw_alerts = [
-                    a for aa, kw, a in alerts_found if aa == asin and kw == keyword
-                ]
-                row.append(" | ".join(kw_alerts) if kw_alerts else "")
+                row.append(" | ".join(alerts_by_kw.get((asin, keyword), ())))
 
                 all_rows.append(row)
 
@@ -1200,25 +1496,12 @@ def update_week(config: AppConfig) -> bool:
             # START PATH: New ASIN, fetch all weeks
             print("  New ASIN, fetching all weeks")
 
-            quarter_weeks = get_quarter_weeks()
-            weekly_snapshots: dict[str, WeeklySnapshot] = {}
-
-            for wk_num, start_date, end_date in quarter_weeks:
-                wk_label = f"W{wk_num:02d}"
-                report_data = fetch_sqp_report(credentials, asin, start_date, end_date)
-                if report_data:
-                    snap = parse_report_to_snapshot(report_data)
-                    if snap:
-                        weekly_snapshots[wk_label] = snap
+            weekly_snapshots = fetched
 
             if not weekly_snapshots:
                 print(f"  [WARNING] No SQP data for new ASIN {asin}, skipping")
                 continue
 
-            listing = None
-            if sku and config.sp_api.seller_id:
-                listing = get_listing_content(config.sp_api.seller_id, sku)
-
             quarterly_keywords = _build_asin_keywords(
                 asin, weekly_snapshots, all_weeks, listing, config
             )
@@ -1283,6 +1566,16 @@ Examples:
         action="store_true",
         help="Update tracker with new week's data for all active ASINs",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached SQP reports and fetch every week from SP-API",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="With --update, refetch the current week even if already tracked",
+    )
     parser.add_argument(
         "--test-sheets",
         action="store_true",
@@ -1303,6 +1596,9 @@ def main() -> int:
         print(f"[ERROR] Failed to load configuration: {e}")
         return 1
 
+    if args.no_cache:
+        set_report_cache_reads(False)
+
     # Test sheets connection
     if args.test_sheets:
         print("Testing Google Sheets connection...")
@@ -1317,7 +1613,7 @@ def main() -> int:
     if args.start:
         return 0 if start_quarter(config) else 1
     elif args.update:
-        return 0 if update_week(config) else 1
+        return 0 if update_week(config, force=args.force) else 1
 
     # No action specified
     parser.print_help()
@@ -1,6 +1,8 @@
 """Configuration loader for SQP Analyzer."""
 
 from dataclasses import dataclass
+from pathlib import Path
+
 from decouple import config
 
 
@@ -53,6 +55,24 @@ class AppConfig:
     thresholds: Thresholds
 
 
+def get_cache_dir() -> Path:
+    """Get the local cache directory (SQP_CACHE_DIR, default ~/.cache/sqp_analyzer)."""
+    default = Path.home() / ".cache" / "sqp_analyzer"
+    return Path(config("SQP_CACHE_DIR", default=str(default))).expanduser()
+
+
+def get_fetch_concurrency() -> tuple[int, int]:
+    """Get how many ASINs, and weeks per ASIN, to fetch SQP reports for at once.
+
+    Read from SQP_ASIN_WORKERS and SQP_WEEK_WORKERS (default 4 each, minimum
+    1). Up to their product reports are polled concurrently; report creation
+    is separately throttled to the SP-API quota.
+    """
+    asin_workers = config("SQP_ASIN_WORKERS", default=4, cast=int)
+    week_workers = config("SQP_WEEK_WORKERS", default=4, cast=int)
+    return max(1, asin_workers), max(1, week_workers)
+
+
 def load_config() -> AppConfig:
     """Load configuration from environment variables."""
     return AppConfig(
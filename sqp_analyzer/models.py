@@ -5,6 +5,9 @@ from datetime import date
 from enum import Enum
 from typing import Any
 
+# Cells written for a week with no metrics (Vol .. Rank Status)
+_EMPTY_WEEK_METRICS = ("", "", "", "", "", "")
+
 
 class RankStatus(Enum):
     """Estimated page position based on impression share."""
@@ -24,7 +27,7 @@ class DiagnosticType(Enum):
     HEALTHY = "healthy"
 
 
-@dataclass
+@dataclass(slots=True)
 class SQPRecord:
     """Single SQP data record for a search query."""
 
@@ -55,6 +58,12 @@ class SQPRecord:
     asin_price: float | None = None
     market_price: float | None = None
 
+    # Lowercased search_query for case-insensitive matching, computed once
+    search_query_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.search_query_lower = self.search_query.lower()
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for sheet output."""
         return {
@@ -77,7 +86,7 @@ class SQPRecord:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklySnapshot:
     """Weekly snapshot of all SQP data for an ASIN."""
 
@@ -89,8 +98,15 @@ class WeeklySnapshot:
         """Get records indexed by search query."""
         return {r.search_query: r for r in self.records}
 
+    def get_records_by_lower_query(self) -> dict[str, SQPRecord]:
+        """Get records indexed by lowercased search query (first match wins)."""
+        index: dict[str, SQPRecord] = {}
+        for r in self.records:
+            index.setdefault(r.search_query_lower, r)
+        return index
 
-@dataclass
+
+@dataclass(slots=True)
 class ListingContent:
     """Listing content for keyword placement detection."""
 
@@ -100,23 +116,37 @@ class ListingContent:
     bullets: list[str] = field(default_factory=list)
     backend_keywords: list[str] = field(default_factory=list)
 
+    # Lowercased title and joined backend text, computed once for matching
+    _title_lower: str = field(init=False, repr=False, compare=False)
+    _backend_lower: str = field(init=False, repr=False, compare=False)
+    # keyword -> (in_title, in_backend); a keyword is checked both for its
+    # placement and for drop alerts, so each answer is reused
+    _matches: dict[str, tuple[bool, bool]] = field(
+        init=False, repr=False, compare=False, default_factory=dict
+    )
+
+    def __post_init__(self) -> None:
+        self._title_lower = self.title.lower()
+        self._backend_lower = " ".join(self.backend_keywords).lower()
+
     def contains_keyword(self, keyword: str) -> tuple[bool, bool]:
         """Check if keyword is in title and/or backend.
 
         Returns:
             Tuple of (in_title, in_backend)
         """
-        keyword_lower = keyword.lower()
-        in_title = keyword_lower in self.title.lower()
-
-        # Check backend keywords
-        backend_text = " ".join(self.backend_keywords).lower()
-        in_backend = keyword_lower in backend_text
-
-        return in_title, in_backend
+        result = self._matches.get(keyword)
+        if result is None:
+            keyword_lower = keyword.lower()
+            result = (
+                keyword_lower in self._title_lower,
+                keyword_lower in self._backend_lower,
+            )
+            self._matches[keyword] = result
+        return result
 
 
-@dataclass
+@dataclass(slots=True)
 class QuarterlyKeyword:
     """A keyword tracked for the quarter with weekly metrics."""
 
@@ -145,18 +175,21 @@ class QuarterlyKeyword:
             "YES" if self.in_backend else "NO",
         ]
 
-        # Add weekly metrics
+        # Add weekly metrics; weeks without data are a shared blank block
+        weekly_get = self.weekly_metrics.get
         for week in weeks_to_include:
-            metrics = self.weekly_metrics.get(week, {})
-            row.extend(
-                [
-                    metrics.get("volume", ""),
-                    metrics.get("imp_share", ""),
-                    metrics.get("click_share", ""),
-                    metrics.get("purchase_share", ""),
-                    metrics.get("opportunity_score", ""),
-                    metrics.get("rank_status", ""),
-                ]
+            metrics = weekly_get(week)
+            if not metrics:
+                row += _EMPTY_WEEK_METRICS
+                continue
+            get = metrics.get
+            row += (
+                get("volume", ""),
+                get("imp_share", ""),
+                get("click_share", ""),
+                get("purchase_share", ""),
+                get("opportunity_score", ""),
+                get("rank_status", ""),
             )
 
         # Add alerts
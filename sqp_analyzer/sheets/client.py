@@ -1,9 +1,13 @@
 """Google Sheets client for reading and writing quarterly tracker data."""
 
+import time
+from collections.abc import Iterable, Sized
+from itertools import islice
 from typing import Any
 
 import gspread
 from google.oauth2.service_account import Credentials
+from gspread.utils import absolute_range_name
 
 from ..config import SheetsConfig
 
@@ -13,6 +17,12 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive",
 ]
 
+# Seconds a tab read stays valid in the client's cache
+VALUES_CACHE_TTL = 60.0
+
+# Maximum rows per values.update request when writing a tracker tab
+WRITE_CHUNK_ROWS = 10_000
+
 
 class SheetsClient:
     """Client for Google Sheets operations."""
@@ -21,6 +31,12 @@ class SheetsClient:
         self.config = config
         self._client: gspread.Client | None = None
         self._spreadsheet: gspread.Spreadsheet | None = None
+        # tab name -> (monotonic timestamp, all values); this client only
+        # ever talks to one spreadsheet, so the tab name is a sufficient key
+        self._values_cache: dict[str, tuple[float, list[list[Any]]]] = {}
+        # tab name -> worksheet handle; each spreadsheet.worksheet() lookup
+        # is a metadata fetch, so handles are reused for the client's lifetime
+        self._worksheets: dict[str, gspread.Worksheet] = {}
 
     def _get_client(self) -> gspread.Client:
         """Get or create authenticated gspread client."""
@@ -47,8 +63,7 @@ class SheetsClient:
 
         Returns list of dicts with keys: asin, variation_asin, sku, active, name, brand, sheet_name
         """
-        spreadsheet = self._get_spreadsheet()
-        worksheet = spreadsheet.worksheet(self.config.master_tab_name)
+        worksheet = self._get_worksheet(self.config.master_tab_name)
         records = worksheet.get_all_records()
 
         asins = []
@@ -95,15 +110,30 @@ class SheetsClient:
         asins = self.read_asins()
         return [a for a in asins if a.get("active", True)]
 
+    def _get_worksheet(self, name: str) -> gspread.Worksheet:
+        """Get an existing worksheet, reusing a previously looked-up handle.
+
+        Raises:
+            gspread.WorksheetNotFound: If the tab doesn't exist
+        """
+        worksheet = self._worksheets.get(name)
+        if worksheet is None:
+            worksheet = self._get_spreadsheet().worksheet(name)
+            self._worksheets[name] = worksheet
+        return worksheet
+
     def _get_or_create_worksheet(
         self, name: str, rows: int = 1000, cols: int = 100
     ) -> gspread.Worksheet:
         """Get existing worksheet or create new one."""
-        spreadsheet = self._get_spreadsheet()
         try:
-            return spreadsheet.worksheet(name)
+            return self._get_worksheet(name)
         except gspread.WorksheetNotFound:
-            return spreadsheet.add_worksheet(title=name, rows=rows, cols=cols)
+            worksheet = self._get_spreadsheet().add_worksheet(
+                title=name, rows=rows, cols=cols
+            )
+            self._worksheets[name] = worksheet
+            return worksheet
 
     def get_quarterly_tracker(self, tab_name: str) -> list[list[Any]] | None:
         """Read existing quarterly tracker data.
@@ -111,39 +141,102 @@ class SheetsClient:
         Args:
             tab_name: Tab name (e.g., 'Q1-B0CSH12L5P')
 
+        Reads are cached for VALUES_CACHE_TTL seconds; any write to the tab
+        through this client invalidates its entry. Each call returns fresh
+        row lists, so callers may modify them without touching the cache.
+
         Returns:
             All values from the tab, or None if tab doesn't exist
         """
-        spreadsheet = self._get_spreadsheet()
+        cached = self._values_cache.get(tab_name)
+        if cached and time.monotonic() - cached[0] < VALUES_CACHE_TTL:
+            return [list(row) for row in cached[1]]
+
         try:
-            worksheet = spreadsheet.worksheet(tab_name)
-            return worksheet.get_all_values()
+            worksheet = self._get_worksheet(tab_name)
+            values = worksheet.get_all_values()
         except gspread.WorksheetNotFound:
             return None
 
+        self._values_cache[tab_name] = (time.monotonic(), values)
+        return [list(row) for row in values]
+
     def write_quarterly_tracker(
         self,
         tab_name: str,
         headers: list[str],
-        rows: list[list[Any]],
+        rows: Iterable[list[Any]],
     ) -> None:
         """Write quarterly tracker data to a tab.
 
+        Rows are consumed lazily and sent as RAW values.update requests of at
+        most WRITE_CHUNK_ROWS rows (headers included in the first), so a
+        large tracker never has to be serialized into one request body. The
+        grid is grown as needed when a chunk runs past the tab's last row.
+
         Args:
             tab_name: Tab name (e.g., 'Q1-B0CSH12L5P')
             headers: Header row
-            rows: Data rows
+            rows: Data rows (any iterable, e.g. a generator)
         """
         # Calculate needed columns (headers + some buffer)
         num_cols = max(len(headers), 100)
+        num_rows = len(rows) + 50 if isinstance(rows, Sized) else 1000
 
         worksheet = self._get_or_create_worksheet(
-            tab_name, rows=len(rows) + 50, cols=num_cols
+            tab_name, rows=num_rows, cols=num_cols
         )
+        self._values_cache.pop(tab_name, None)
         worksheet.clear()
 
-        all_rows = [headers] + rows
-        worksheet.update(values=all_rows, range_name="A1")
+        row_iter = iter(rows)
+        start_row = 1
+        chunk: list[list[Any]] = [headers, *islice(row_iter, WRITE_CHUNK_ROWS - 1)]
+        while chunk:
+            end_row = start_row + len(chunk) - 1
+            if end_row > worksheet.row_count:
+                worksheet.add_rows(end_row - worksheet.row_count)
+            worksheet.update(
+                values=chunk, range_name=f"A{start_row}", value_input_option="RAW"
+            )
+            start_row = end_row + 1
+            chunk = list(islice(row_iter, WRITE_CHUNK_ROWS))
+
+    def write_tabs(self, tabs: dict[str, list[list[Any]]]) -> None:
+        """Replace the contents of several tabs in one clear and one write.
+
+        Tabs are created if missing. All ranges are cleared with a single
+        values.batchClear and written with a single values.batchUpdate
+        (RAW input), instead of a clear and update round-trip per tab.
+
+        Args:
+            tabs: Mapping of tab name to rows (first row is the header)
+        """
+        if not tabs:
+            return
+
+        for name in tabs:
+            self._values_cache.pop(name, None)
+
+        for name, values in tabs.items():
+            self._get_or_create_worksheet(
+                name,
+                rows=len(values) + 50,
+                cols=max((len(r) for r in values), default=0) + 10,
+            )
+
+        ranges = [absolute_range_name(name) for name in tabs]
+        spreadsheet = self._get_spreadsheet()
+        spreadsheet.values_batch_clear(body={"ranges": ranges})
+        spreadsheet.values_batch_update(
+            body={
+                "valueInputOption": "RAW",
+                "data": [
+                    {"range": absolute_range_name(name, "A1"), "values": values}
+                    for name, values in tabs.items()
+                ],
+            }
+        )
 
     def update_quarterly_tracker_row(
         self,
@@ -160,8 +253,8 @@ class SheetsClient:
             values: Values to write
             start_col: Starting column (1-indexed, default A)
         """
-        spreadsheet = self._get_spreadsheet()
-        worksheet = spreadsheet.worksheet(tab_name)
+        self._values_cache.pop(tab_name, None)
+        worksheet = self._get_worksheet(tab_name)
 
         # Convert column number to letter
         end_col = start_col + len(values) - 1
@@ -0,0 +1,9 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Point the on-disk cache at a temp dir so tests never see real entries."""
+    monkeypatch.setenv("SQP_CACHE_DIR", str(tmp_path / "cache"))
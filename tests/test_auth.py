@@ -0,0 +1,60 @@
+"""Tests for LWA token caching."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from sqp_analyzer.amazon.auth import SPAPIAuth
+from sqp_analyzer.config import SPAPIConfig
+
+
+def _config(refresh_token: str = "refresh-a") -> SPAPIConfig:
+    return SPAPIConfig(
+        client_id="client",
+        client_secret="secret",
+        refresh_token=refresh_token,
+        aws_access_key="",
+        aws_secret_key="",
+        role_arn="",
+        marketplace_id="ATVPDKIKX0DER",
+        seller_id="SELLER",
+    )
+
+
+def _token_response(token: str) -> MagicMock:
+    response = MagicMock()
+    response.json.return_value = {"access_token": token, "expires_in": 3600}
+    return response
+
+
+class TestSPAPIAuthCache:
+    def test_cache_is_keyed_by_refresh_token(self):
+        with patch("sqp_analyzer.amazon.auth.requests.post") as mock_post:
+            mock_post.return_value = _token_response("token-a")
+            assert SPAPIAuth(_config("refresh-a")).get_access_token() == "token-a"
+
+            mock_post.return_value = _token_response("token-b")
+            assert SPAPIAuth(_config("refresh-b")).get_access_token() == "token-b"
+
+        assert mock_post.call_count == 2
+
+    def test_concurrent_callers_share_one_refresh(self):
+        auth = SPAPIAuth(_config())
+        barrier = threading.Barrier(8)
+
+        def post(*args, **kwargs):
+            return _token_response("token")
+
+        def call():
+            barrier.wait()
+            auth.get_access_token()
+
+        with patch(
+            "sqp_analyzer.amazon.auth.requests.post", side_effect=post
+        ) as mock_post:
+            threads = [threading.Thread(target=call) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert mock_post.call_count == 1
@@ -0,0 +1,96 @@
+"""Tests for batched listing lookups."""
+
+from unittest.mock import MagicMock, patch
+
+from sp_api.base import (
+    SellingApiForbiddenException,
+    SellingApiRequestThrottledException,
+)
+
+from sqp_analyzer.commands.fetch_listing import (
+    LISTINGS_SEARCH_BATCH,
+    _fetch_listing_content,
+    get_listing_content,
+    get_listings_bulk,
+)
+
+
+def _item(sku: str, title: str) -> dict:
+    return {
+        "sku": sku,
+        "summaries": [{"asin": f"ASIN-{sku}", "itemName": title}],
+        "attributes": {"generic_keyword": [{"value": "garlic mincer"}]},
+    }
+
+
+@patch("sqp_analyzer.commands.fetch_listing.get_credentials", return_value={})
+@patch("sqp_analyzer.commands.fetch_listing.get_listings_api")
+class TestGetListingsBulk:
+    def test_batches_skus_and_marks_missing(self, mock_listings_cls, _creds):
+        api = mock_listings_cls.return_value
+        skus = [f"SKU-{i:03d}" for i in range(LISTINGS_SEARCH_BATCH + 1)]
+
+        def search(**kwargs):
+            batch = kwargs["identifiers"].split(",")
+            # Amazon omits SKUs it doesn't know
+            items = [_item(sku, "Garlic Press") for sku in batch if sku != "SKU-001"]
+            return MagicMock(payload={"items": items})
+
+        api.search_listings_items.side_effect = search
+
+        result = get_listings_bulk("SELLER", skus)
+
+        assert api.search_listings_items.call_count == 2
+        assert list(result) == skus
+        assert result["SKU-001"] is None
+        listing = result["SKU-000"]
+        assert listing.asin == "ASIN-SKU-000"
+        assert listing.contains_keyword("garlic mincer") == (False, True)
+
+    @patch("sqp_analyzer.commands.fetch_listing.get_listing_content")
+    def test_failed_batch_falls_back_per_sku(self, mock_get, mock_listings_cls, _creds):
+        mock_listings_cls.return_value.search_listings_items.side_effect = (
+            SellingApiRequestThrottledException(
+                [{"code": "QuotaExceeded", "message": "throttled"}], headers={}
+            )
+        )
+        mock_get.side_effect = lambda seller_id, sku: f"listing-{sku}"
+
+        result = get_listings_bulk("SELLER", ["SKU-1", "SKU-2"])
+
+        assert result == {"SKU-1": "listing-SKU-1", "SKU-2": "listing-SKU-2"}
+
+    @patch("sqp_analyzer.commands.fetch_listing.get_listing_content")
+    def test_auth_error_does_not_fall_back(self, mock_get, mock_listings_cls, _creds):
+        mock_listings_cls.return_value.search_listings_items.side_effect = (
+            SellingApiForbiddenException(
+                [{"code": "Unauthorized", "message": "denied"}], headers={}
+            )
+        )
+
+        result = get_listings_bulk("SELLER", ["SKU-1", "SKU-2"])
+
+        assert result == {"SKU-1": None, "SKU-2": None}
+        mock_get.assert_not_called()
+
+
+@patch("sqp_analyzer.commands.fetch_listing.get_credentials", return_value={})
+@patch("sqp_analyzer.commands.fetch_listing.get_listings_api")
+class TestGetListingContent:
+    def setup_method(self):
+        _fetch_listing_content.cache_clear()
+
+    def test_failure_is_not_cached(self, mock_listings_cls, _creds):
+        api = mock_listings_cls.return_value
+        api.get_listings_item.side_effect = [
+            RuntimeError("throttled"),
+            MagicMock(payload=_item("SKU-1", "Garlic Press")),
+        ]
+
+        assert get_listing_content("SELLER", "SKU-1") is None
+        listing = get_listing_content("SELLER", "SKU-1")
+        assert listing is not None and listing.title == "Garlic Press"
+
+        # The successful lookup is cached
+        assert get_listing_content("SELLER", "SKU-1") is listing
+        assert api.get_listings_item.call_count == 2
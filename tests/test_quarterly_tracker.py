@@ -1,8 +1,11 @@
 """Tests for consolidated quarterly tracker with mock data for 3 ASINs."""
 
-from datetime import date
+import threading
+from dataclasses import replace
+from datetime import date, timedelta
 from unittest.mock import MagicMock, patch
 
+from sp_api.base import SellingApiRequestThrottledException
 
 from sqp_analyzer.commands.quarterly_tracker import (
     build_asin_separator_row,
@@ -10,18 +13,29 @@ from sqp_analyzer.commands.quarterly_tracker import (
     get_consolidated_tab_name,
     is_asin_separator_row,
     parse_consolidated_sheet,
+    parse_report_to_snapshot,
     start_quarter,
     update_week,
     _build_asin_keywords,
     extract_week_metrics,
     detect_drastic_changes,
+    fetch_sqp_report,
+    check_keyword_alerts,
+    check_keyword_alerts_bulk,
+    _quarter_bounds,
+    get_quarter_weeks,
     build_asin_summary,
     build_dashboard,
     generate_dashboard,
     DASHBOARD_TAB_NAME,
 )
 from sqp_analyzer.config import AppConfig, SheetsConfig, SPAPIConfig, Thresholds
-from sqp_analyzer.models import QuarterlyKeyword, SQPRecord, WeeklySnapshot
+from sqp_analyzer.models import (
+    ListingContent,
+    QuarterlyKeyword,
+    SQPRecord,
+    WeeklySnapshot,
+)
 
 
 # --- Mock data for 3 ASINs ---
@@ -125,6 +139,26 @@ def _make_snapshot(asin: str, week_date: date) -> WeeklySnapshot:
     )
 
 
+def _make_report_data(asin: str, week_date: date) -> dict:
+    """Create a mock SQP report document for an ASIN/week."""
+    return {
+        "reportSpecification": {"dataStartTime": week_date.isoformat()},
+        "dataByAsin": [
+            {
+                "asin": asin,
+                "searchQueryData": {
+                    "searchQuery": r.search_query,
+                    "searchQueryVolume": r.search_volume,
+                },
+                "impressionData": {"asinImpressionShare": r.impressions_share},
+                "clickData": {"asinClickShare": r.clicks_share},
+                "purchaseData": {"asinPurchaseShare": r.purchases_share},
+            }
+            for r in _make_sqp_records(asin, week_date)
+        ],
+    }
+
+
 def _build_mock_consolidated_sheet(week_labels: list[str]) -> list[list]:
     """Build a complete mock consolidated sheet with headers + data for 3 ASINs."""
     headers = build_headers(week_labels)
@@ -174,6 +208,39 @@ class TestBuildHeaders:
         assert len(headers) == 5 + 12 + 1
 
 
+class TestQuarterBounds:
+    def test_mid_quarter(self):
+        # Wed 2026-02-18: Q1 week 7; Q1 2026 starts Thu, first Sunday Jan 4
+        quarter, year, week, first_sunday, last_saturday = _quarter_bounds(
+            date(2026, 2, 18).toordinal()
+        )
+        assert (quarter, year, week) == (1, 2026, 7)
+        assert first_sunday == date(2026, 1, 4)
+        assert last_saturday == date(2026, 2, 14)
+
+    def test_saturday_is_not_yet_complete(self):
+        last_saturday = _quarter_bounds(date(2026, 2, 14).toordinal())[4]
+        assert last_saturday == date(2026, 2, 7)
+
+    def test_week_is_capped_at_13(self):
+        assert _quarter_bounds(date(2026, 3, 31).toordinal())[2] == 13
+
+    def test_quarter_weeks_are_complete_sunday_to_saturday(self):
+        class FixedDate(date):
+            @classmethod
+            def today(cls):
+                return cls(2026, 1, 27)
+
+        with patch("sqp_analyzer.commands.quarterly_tracker.date", FixedDate):
+            weeks = get_quarter_weeks()
+
+        assert weeks == [
+            (1, date(2026, 1, 4), date(2026, 1, 10)),
+            (2, date(2026, 1, 11), date(2026, 1, 17)),
+            (3, date(2026, 1, 18), date(2026, 1, 24)),
+        ]
+
+
 class TestQuarterlyKeywordToRow:
     def test_includes_asin(self):
         qk = QuarterlyKeyword(
@@ -201,6 +268,50 @@ class TestQuarterlyKeywordToRow:
         assert row[4] == "NO"
         assert row[5] == 5000  # W01 Vol
 
+    def test_missing_week_is_blank(self):
+        qk = QuarterlyKeyword(
+            asin="B0ASIN0001",
+            rank=1,
+            keyword="garlic press",
+            weekly_metrics={"W02": {"volume": 4000, "rank_status": "invisible"}},
+        )
+        row = qk.to_row(["W01", "W02"])
+        assert row[5:11] == ["", "", "", "", "", ""]
+        assert row[11:17] == [4000, "", "", "", "", "invisible"]
+        assert row[-1] == ""
+        assert len(row) == 5 + 6 * 2 + 1
+
+
+class TestCheckKeywordAlertsBulk:
+    def test_matches_single_keyword_checks(self):
+        listing = ListingContent(
+            asin="B0ASIN0001",
+            sku="SKU-001",
+            title="Garlic Press Stainless Steel",
+            backend_keywords=["mincer crusher"],
+        )
+        previous = {
+            "garlic press": (True, True),
+            "garlic mincer": (True, False),
+            "crusher": (False, True),
+            "garlic presser": (False, False),
+        }
+
+        bulk = check_keyword_alerts_bulk(listing, previous)
+
+        for keyword, (in_title, in_backend) in previous.items():
+            expected = check_keyword_alerts(keyword, listing, in_title, in_backend)
+            assert bulk[keyword][2] == expected
+        assert bulk == {
+            "garlic press": (True, False, ["DROPPED FROM BACKEND"]),
+            "garlic mincer": (False, False, ["DROPPED FROM TITLE"]),
+            "crusher": (False, True, []),
+            "garlic presser": (False, False, []),
+        }
+
+    def test_no_listing_means_no_alerts(self):
+        assert check_keyword_alerts_bulk(None, {"garlic press": (True, True)}) == {}
+
 
 class TestBuildAsinSeparatorRow:
     def test_correct_format(self):
@@ -307,8 +418,259 @@ class TestGetConsolidatedTabName:
         assert result[1:].isdigit()
 
 
+class TestParseReportToSnapshot:
+    def test_parses_entries_into_records(self):
+        report = {
+            "reportSpecification": {"dataStartTime": "2026-01-04T00:00:00Z"},
+            "dataByAsin": [
+                {
+                    "asin": "B0ASIN0001",
+                    "searchQueryData": {
+                        "searchQuery": "garlic press",
+                        "searchQueryVolume": 5000,
+                        "searchQueryScore": 1,
+                    },
+                    "impressionData": {
+                        "totalImpressions": 10000,
+                        "asinImpressions": 1200,
+                        "asinImpressionShare": 12.0,
+                    },
+                    "clickData": {"asinClickShare": 4.5},
+                    "purchaseData": {"asinPurchaseShare": 3.0},
+                }
+            ],
+        }
+        snapshot = parse_report_to_snapshot(report)
+
+        assert snapshot.asin == "B0ASIN0001"
+        assert snapshot.week_date == date(2026, 1, 4)
+        record = snapshot.records[0]
+        assert record.search_query == "garlic press"
+        assert record.search_volume == 5000
+        assert record.impressions_share == 12.0
+        assert record.clicks_share == 4.5
+        assert record.clicks_total == 0
+        assert record.purchases_share == 3.0
+
+    def test_null_sections_and_values_default_to_zero(self):
+        report = {
+            "reportSpecification": {"dataStartTime": "2026-01-04"},
+            "dataByAsin": [
+                {
+                    "asin": "B0ASIN0001",
+                    "searchQueryData": {"searchQuery": None, "searchQueryVolume": None},
+                    "impressionData": None,
+                }
+            ],
+        }
+        record = parse_report_to_snapshot(report).records[0]
+
+        assert record.search_query == ""
+        assert record.search_volume == 0
+        assert record.impressions_share == 0
+        assert record.purchases_asin == 0
+
+    def test_error_report_returns_none(self):
+        assert parse_report_to_snapshot({"errorDetails": "bad"}) is None
+
+
+class TestBuildAsinKeywords:
+    def test_matches_earlier_weeks_case_insensitively(self):
+        asin = "B0ASIN0001"
+        w01 = _make_snapshot(asin, date(2026, 1, 5))
+        w01.records = [
+            replace(r, search_query=r.search_query.upper()) for r in w01.records
+        ]
+        snapshots = {"W01": w01, "W02": _make_snapshot(asin, date(2026, 1, 12))}
+
+        keywords = _build_asin_keywords(
+            asin, snapshots, ["W01", "W02", "W03"], None, _make_mock_config()
+        )
+
+        top = keywords[0]
+        assert top.keyword == "garlic press"
+        assert top.weekly_metrics["W01"]["volume"] == 5000
+        assert top.weekly_metrics["W02"]["volume"] == 5000
+        assert top.weekly_metrics["W03"]["rank_status"] == "-"
+
+    def test_keyword_missing_from_week_is_invisible(self):
+        asin = "B0ASIN0001"
+        w01 = _make_snapshot(asin, date(2026, 1, 5))
+        w01.records = [r for r in w01.records if r.search_query != "garlic press"]
+        snapshots = {"W01": w01, "W02": _make_snapshot(asin, date(2026, 1, 12))}
+
+        keywords = _build_asin_keywords(
+            asin, snapshots, ["W01", "W02"], None, _make_mock_config()
+        )
+
+        assert keywords[0].weekly_metrics["W01"]["volume"] == "-"
+        assert keywords[0].weekly_metrics["W01"]["rank_status"] == "invisible"
+
+
+class TestFetchSqpReportPolling:
+    def _mock_reports(self, statuses, headers=None):
+        report = MagicMock()
+        report.create_report.return_value = MagicMock(payload={"reportId": "R1"})
+        report.get_report.side_effect = [
+            MagicMock(
+                payload={"processingStatus": status, "reportDocumentId": None},
+                headers=headers or {},
+            )
+            for status in statuses
+        ]
+        return report
+
+    @patch("sqp_analyzer.commands.quarterly_tracker.random.uniform", return_value=0)
+    @patch("sqp_analyzer.commands.quarterly_tracker.time.sleep")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_reports_api")
+    def test_backs_off_exponentially_up_to_cap(self, mock_reports, mock_sleep, _):
+        mock_reports.return_value = self._mock_reports(
+            ["IN_QUEUE", "IN_PROGRESS", "IN_PROGRESS", "IN_PROGRESS", "CANCELLED"]
+        )
+
+        result = fetch_sqp_report(
+            {},
+            "B0ASIN0001",
+            date(2026, 1, 4),
+            date(2026, 1, 10),
+            initial_interval=5,
+            max_interval=30,
+        )
+
+        assert result is None
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        assert waits == [5, 10, 20, 30]
+
+    @patch("sqp_analyzer.commands.quarterly_tracker._GET_REPORT_LIMITER")
+    @patch("sqp_analyzer.commands.quarterly_tracker.random.uniform", return_value=0)
+    @patch("sqp_analyzer.commands.quarterly_tracker.time.sleep")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_reports_api")
+    def test_each_status_check_takes_a_token(self, mock_reports, _sleep, _, limiter):
+        mock_reports.return_value = self._mock_reports(
+            ["IN_QUEUE", "IN_PROGRESS", "CANCELLED"]
+        )
+
+        fetch_sqp_report({}, "B0ASIN0001", date(2026, 1, 4), date(2026, 1, 10))
+
+        assert limiter.acquire.call_count == 3
+
+    @patch("sqp_analyzer.commands.quarterly_tracker.random.uniform", return_value=0)
+    @patch("sqp_analyzer.commands.quarterly_tracker.time.sleep")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_reports_api")
+    def test_throttled_poll_honors_retry_after_and_continues(
+        self, mock_reports, mock_sleep, _
+    ):
+        report = self._mock_reports(["IN_QUEUE", "CANCELLED"])
+        throttled = SellingApiRequestThrottledException(
+            [{"code": "QuotaExceeded", "message": "throttled"}],
+            headers={"Retry-After": "45"},
+        )
+        report.get_report.side_effect = [throttled, *report.get_report.side_effect]
+        mock_reports.return_value = report
+
+        result = fetch_sqp_report({}, "B0ASIN0001", date(2026, 1, 4), date(2026, 1, 10))
+
+        assert result is None
+        assert report.get_report.call_count == 3
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        assert waits == [45.0, 10.0]
+
+    @patch("sqp_analyzer.commands.quarterly_tracker.random.uniform", return_value=0)
+    @patch("sqp_analyzer.commands.quarterly_tracker.time")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_reports_api")
+    def test_last_sleep_is_capped_at_deadline(self, mock_reports, mock_time, _):
+        clock = [0.0]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_time.sleep.side_effect = sleep
+        report = self._mock_reports(["IN_PROGRESS"] * 100)
+        mock_reports.return_value = report
+
+        result = fetch_sqp_report(
+            {},
+            "B0ASIN0001",
+            date(2026, 1, 4),
+            date(2026, 1, 10),
+            initial_interval=1000,
+            max_interval=1000,
+        )
+
+        assert result is None
+        sleeps = [c.args[0] for c in mock_time.sleep.call_args_list]
+        assert sleeps == [1000, 1000, 1000, 600]
+        assert clock[0] == 3600
+
+
+class TestFetchSqpReportCache:
+    @patch("sqp_analyzer.commands.quarterly_tracker.download_report_document")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_reports_api")
+    def test_completed_report_is_reused(self, mock_reports, mock_download):
+        report = MagicMock()
+        report.create_report.return_value = MagicMock(payload={"reportId": "R1"})
+        report.get_report.return_value = MagicMock(
+            payload={"processingStatus": "DONE", "reportDocumentId": "D1"}
+        )
+        report.get_report_document.return_value = MagicMock(
+            payload={"url": "https://example.com/doc", "compressionAlgorithm": "GZIP"}
+        )
+        mock_reports.return_value = report
+        mock_download.return_value = _make_report_data("B0ASIN0001", date(2026, 1, 4))
+
+        args = ({}, "B0ASIN0001", date(2026, 1, 4), date(2026, 1, 10))
+        first = fetch_sqp_report(*args)
+        second = fetch_sqp_report(*args)
+
+        assert first == second == mock_download.return_value
+        assert report.create_report.call_count == 1
+        assert mock_download.call_count == 1
+
+    @patch("sqp_analyzer.commands.quarterly_tracker.download_report_document")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_reports_api")
+    def test_recent_week_is_not_cached(self, mock_reports, mock_download):
+        report = MagicMock()
+        report.create_report.return_value = MagicMock(payload={"reportId": "R1"})
+        report.get_report.return_value = MagicMock(
+            payload={"processingStatus": "DONE", "reportDocumentId": "D1"}
+        )
+        report.get_report_document.return_value = MagicMock(
+            payload={"url": "https://example.com/doc", "compressionAlgorithm": "GZIP"}
+        )
+        mock_reports.return_value = report
+        end = date.today() - timedelta(days=1)
+        start = end - timedelta(days=6)
+        mock_download.return_value = _make_report_data("B0ASIN0001", start)
+
+        fetch_sqp_report({}, "B0ASIN0001", start, end)
+        fetch_sqp_report({}, "B0ASIN0001", start, end)
+
+        assert report.create_report.call_count == 2
+
+    @patch("sqp_analyzer.commands.quarterly_tracker.download_report_document")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_reports_api")
+    def test_empty_report_is_not_cached(self, mock_reports, mock_download):
+        report = MagicMock()
+        report.create_report.return_value = MagicMock(payload={"reportId": "R1"})
+        report.get_report.return_value = MagicMock(
+            payload={"processingStatus": "DONE", "reportDocumentId": "D1"}
+        )
+        report.get_report_document.return_value = MagicMock(
+            payload={"url": "https://example.com/doc", "compressionAlgorithm": "GZIP"}
+        )
+        mock_reports.return_value = report
+        mock_download.return_value = {"reportSpecification": {}, "dataByAsin": []}
+
+        args = ({}, "B0ASIN0001", date(2026, 1, 4), date(2026, 1, 10))
+        fetch_sqp_report(*args)
+        fetch_sqp_report(*args)
+
+        assert report.create_report.call_count == 2
+
+
 class TestStartQuarterConsolidated:
-    @patch("sqp_analyzer.commands.quarterly_tracker.get_listing_content")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_listings_bulk")
     @patch("sqp_analyzer.commands.quarterly_tracker.fetch_sqp_report")
     @patch("sqp_analyzer.commands.quarterly_tracker.get_credentials")
     @patch("sqp_analyzer.commands.quarterly_tracker.get_quarter_weeks")
@@ -334,7 +696,7 @@ class TestStartQuarterConsolidated:
             "lwa_app_id": "t",
             "lwa_client_secret": "t",
         }
-        mock_listing.return_value = None
+        mock_listing.return_value = {}
 
         # Mock sheets client
         mock_sheets = MagicMock()
@@ -411,35 +773,135 @@ class TestStartQuarterConsolidated:
         dashboard_call = mock_sheets.write_quarterly_tracker.call_args_list[1]
         assert dashboard_call[0][0] == DASHBOARD_TAB_NAME
 
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_listings_bulk")
+    @patch("sqp_analyzer.commands.quarterly_tracker.fetch_sqp_report")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_credentials")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_quarter_weeks")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_current_quarter")
+    @patch("sqp_analyzer.commands.quarterly_tracker.SheetsClient")
+    def test_fetches_asins_concurrently_in_master_order(
+        self,
+        mock_sheets_cls,
+        mock_quarter,
+        mock_weeks,
+        mock_creds,
+        mock_fetch,
+        mock_listing,
+    ):
+        mock_quarter.return_value = (1, 2026)
+        mock_weeks.return_value = [(1, date(2026, 1, 5), date(2026, 1, 11))]
+        mock_creds.return_value = {}
+        mock_listing.return_value = {}
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_active_asins.return_value = MOCK_ASINS
+        mock_sheets.get_quarterly_tracker.return_value = _build_mock_consolidated_sheet(
+            ["W01"]
+        )
+        mock_sheets_cls.return_value = mock_sheets
+
+        # The first ASIN only finishes once the last one has started, which
+        # can only happen if ASINs are fetched concurrently
+        last_started = threading.Event()
+
+        def fake_fetch(creds, asin, start, end):
+            if asin == "B0ASIN0003":
+                last_started.set()
+            elif asin == "B0ASIN0001":
+                assert last_started.wait(timeout=5)
+            return _make_report_data(asin, start)
+
+        mock_fetch.side_effect = fake_fetch
+
+        assert start_quarter(_make_mock_config()) is True
+
+        rows = mock_sheets.write_quarterly_tracker.call_args_list[0][0][2]
+        separator_asins = [r[0] for r in rows if is_asin_separator_row(r)]
+        assert separator_asins == ["B0ASIN0001", "B0ASIN0002", "B0ASIN0003"]
+
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_listings_bulk")
+    @patch("sqp_analyzer.commands.quarterly_tracker.fetch_sqp_report")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_credentials")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_quarter_weeks")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_current_quarter")
+    @patch("sqp_analyzer.commands.quarterly_tracker.SheetsClient")
+    def test_sp_api_error_skips_only_that_week(
+        self,
+        mock_sheets_cls,
+        mock_quarter,
+        mock_weeks,
+        mock_creds,
+        mock_fetch,
+        mock_listing,
+    ):
+        mock_quarter.return_value = (1, 2026)
+        mock_weeks.return_value = [
+            (1, date(2026, 1, 5), date(2026, 1, 11)),
+            (2, date(2026, 1, 12), date(2026, 1, 18)),
+        ]
+        mock_creds.return_value = {}
+        mock_listing.return_value = {}
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_active_asins.return_value = MOCK_ASINS
+        mock_sheets.get_quarterly_tracker.return_value = _build_mock_consolidated_sheet(
+            ["W01", "W02"]
+        )
+        mock_sheets_cls.return_value = mock_sheets
+
+        def fake_fetch(creds, asin, start, end):
+            if asin == "B0ASIN0002" and start == date(2026, 1, 12):
+                raise SellingApiRequestThrottledException(
+                    [{"code": "QuotaExceeded", "message": "throttled"}], headers={}
+                )
+            return _make_report_data(asin, start)
+
+        mock_fetch.side_effect = fake_fetch
+
+        assert start_quarter(_make_mock_config()) is True
+
+        headers, rows = mock_sheets.write_quarterly_tracker.call_args_list[0][0][1:]
+        separator_asins = [r[0] for r in rows if is_asin_separator_row(r)]
+        assert separator_asins == ["B0ASIN0001", "B0ASIN0002", "B0ASIN0003"]
+        w02_vol = headers.index("W02 Vol")
+        asin2_rows = [
+            r for r in rows if r[0] == "B0ASIN0002" and not is_asin_separator_row(r)
+        ]
+        assert asin2_rows and all(r[w02_vol] == "-" for r in asin2_rows)
+
 
 class TestUpdateWeekConsolidated:
-    @patch("sqp_analyzer.commands.quarterly_tracker.get_listing_content")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_listings_bulk")
     @patch("sqp_analyzer.commands.quarterly_tracker.fetch_sqp_report")
     @patch("sqp_analyzer.commands.quarterly_tracker.get_credentials")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_quarter_weeks")
     @patch("sqp_analyzer.commands.quarterly_tracker.get_last_complete_week")
-    @patch("sqp_analyzer.commands.quarterly_tracker.get_week_in_quarter")
     @patch("sqp_analyzer.commands.quarterly_tracker.get_current_quarter")
     @patch("sqp_analyzer.commands.quarterly_tracker.SheetsClient")
     def test_merges_new_week(
         self,
         mock_sheets_cls,
         mock_quarter,
-        mock_week_num,
         mock_last_week,
+        mock_weeks,
         mock_creds,
         mock_fetch,
         mock_listing,
     ):
         # Setup
         mock_quarter.return_value = (1, 2026)
-        mock_week_num.return_value = 3
         mock_last_week.return_value = (date(2026, 1, 19), date(2026, 1, 25))
+        mock_weeks.return_value = [
+            (1, date(2026, 1, 5), date(2026, 1, 11)),
+            (2, date(2026, 1, 12), date(2026, 1, 18)),
+            (3, date(2026, 1, 19), date(2026, 1, 25)),
+        ]
         mock_creds.return_value = {
             "refresh_token": "t",
             "lwa_app_id": "t",
             "lwa_client_secret": "t",
         }
-        mock_listing.return_value = None
+        mock_listing.return_value = {}
 
         # Build existing sheet with W01 and W02
         existing_sheet = _build_mock_consolidated_sheet(["W01", "W02"])
@@ -518,6 +980,186 @@ class TestUpdateWeekConsolidated:
         dashboard_call = mock_sheets.write_quarterly_tracker.call_args_list[1]
         assert dashboard_call[0][0] == DASHBOARD_TAB_NAME
 
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_listings_bulk")
+    @patch("sqp_analyzer.commands.quarterly_tracker.fetch_sqp_report")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_credentials")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_quarter_weeks")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_last_complete_week")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_current_quarter")
+    @patch("sqp_analyzer.commands.quarterly_tracker.SheetsClient")
+    def test_new_asin_gets_full_quarter(
+        self,
+        mock_sheets_cls,
+        mock_quarter,
+        mock_last_week,
+        mock_weeks,
+        mock_creds,
+        mock_fetch,
+        mock_listing,
+    ):
+        mock_quarter.return_value = (1, 2026)
+        mock_last_week.return_value = (date(2026, 1, 19), date(2026, 1, 25))
+        mock_weeks.return_value = [
+            (1, date(2026, 1, 5), date(2026, 1, 11)),
+            (2, date(2026, 1, 12), date(2026, 1, 18)),
+            (3, date(2026, 1, 19), date(2026, 1, 25)),
+        ]
+        mock_creds.return_value = {}
+        mock_listing.return_value = {}
+
+        # Existing sheet only tracks the first two ASINs
+        existing_sheet = [
+            r
+            for r in _build_mock_consolidated_sheet(["W01", "W02"])
+            if r[0] != "B0ASIN0003"
+        ]
+        mock_sheets = MagicMock()
+        mock_sheets.get_active_asins.return_value = MOCK_ASINS
+        mock_sheets.get_quarterly_tracker.return_value = existing_sheet
+        mock_sheets_cls.return_value = mock_sheets
+
+        mock_fetch.side_effect = lambda creds, asin, start, end: _make_report_data(
+            asin, start
+        )
+
+        assert update_week(_make_mock_config()) is True
+
+        # 2 existing ASINs fetch the current week, the new one all 3 weeks
+        assert mock_fetch.call_count == 5
+        mock_weeks.assert_called_once()
+
+        rows = mock_sheets.write_quarterly_tracker.call_args_list[0][0][2]
+        separator_asins = [r[0] for r in rows if is_asin_separator_row(r)]
+        assert separator_asins == ["B0ASIN0001", "B0ASIN0002", "B0ASIN0003"]
+        new_rows = [r for r in rows if r[0] == "B0ASIN0003" and r[1]]
+        assert len(new_rows) == 10
+
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_listings_bulk")
+    @patch("sqp_analyzer.commands.quarterly_tracker.fetch_sqp_report")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_credentials")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_quarter_weeks")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_last_complete_week")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_current_quarter")
+    @patch("sqp_analyzer.commands.quarterly_tracker.SheetsClient")
+    def test_alert_only_on_dropped_keyword_row(
+        self,
+        mock_sheets_cls,
+        mock_quarter,
+        mock_last_week,
+        mock_weeks,
+        mock_creds,
+        mock_fetch,
+        mock_listing,
+    ):
+        mock_quarter.return_value = (1, 2026)
+        mock_last_week.return_value = (date(2026, 1, 19), date(2026, 1, 25))
+        mock_weeks.return_value = [
+            (1, date(2026, 1, 5), date(2026, 1, 11)),
+            (2, date(2026, 1, 12), date(2026, 1, 18)),
+            (3, date(2026, 1, 19), date(2026, 1, 25)),
+        ]
+        mock_creds.return_value = {}
+        mock_listing.side_effect = lambda seller_id, skus: {
+            sku: ListingContent(asin="", sku=sku, title="Stainless steel kitchen tool")
+            for sku in skus
+        }
+
+        # "garlic press" was in B0ASIN0001's title last week
+        existing_sheet = _build_mock_consolidated_sheet(["W01", "W02"])
+        for row in existing_sheet:
+            if row[0] == "B0ASIN0001" and row[2] == "garlic press":
+                row[3] = "YES"
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_active_asins.return_value = MOCK_ASINS
+        mock_sheets.get_quarterly_tracker.return_value = existing_sheet
+        mock_sheets_cls.return_value = mock_sheets
+
+        mock_fetch.side_effect = lambda creds, asin, start, end: _make_report_data(
+            asin, start
+        )
+
+        assert update_week(_make_mock_config()) is True
+
+        rows = mock_sheets.write_quarterly_tracker.call_args_list[0][0][2]
+        alerts = {(r[0], r[2]): r[-1] for r in rows if r[1]}
+        assert alerts[("B0ASIN0001", "garlic press")] == "DROPPED FROM TITLE"
+        assert [a for a in alerts.values() if a] == ["DROPPED FROM TITLE"]
+
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_listings_bulk")
+    @patch("sqp_analyzer.commands.quarterly_tracker.fetch_sqp_report")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_credentials")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_quarter_weeks")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_last_complete_week")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_current_quarter")
+    @patch("sqp_analyzer.commands.quarterly_tracker.SheetsClient")
+    def test_rerun_for_tracked_week_reuses_rows(
+        self,
+        mock_sheets_cls,
+        mock_quarter,
+        mock_last_week,
+        mock_weeks,
+        mock_creds,
+        mock_fetch,
+        mock_listing,
+    ):
+        mock_quarter.return_value = (1, 2026)
+        mock_last_week.return_value = (date(2026, 1, 12), date(2026, 1, 18))
+        mock_weeks.return_value = [
+            (1, date(2026, 1, 5), date(2026, 1, 11)),
+            (2, date(2026, 1, 12), date(2026, 1, 18)),
+        ]
+        mock_creds.return_value = {}
+        mock_listing.return_value = {}
+
+        existing_sheet = _build_mock_consolidated_sheet(["W01", "W02"])
+        mock_sheets = MagicMock()
+        mock_sheets.get_active_asins.return_value = MOCK_ASINS
+        mock_sheets.get_quarterly_tracker.return_value = existing_sheet
+        mock_sheets_cls.return_value = mock_sheets
+
+        mock_fetch.side_effect = lambda creds, asin, start, end: _make_report_data(
+            asin, start
+        )
+
+        assert update_week(_make_mock_config()) is True
+        mock_fetch.assert_not_called()
+        headers, rows = mock_sheets.write_quarterly_tracker.call_args_list[0][0][1:]
+        assert [headers, *rows] == existing_sheet
+
+        mock_sheets.write_quarterly_tracker.reset_mock()
+        assert update_week(_make_mock_config(), force=True) is True
+        assert mock_fetch.call_count == len(MOCK_ASINS)
+
+        # Once a newer week completes it is fetched, whatever today's
+        # calendar week-of-quarter is
+        mock_fetch.reset_mock()
+        mock_last_week.return_value = (date(2026, 1, 19), date(2026, 1, 25))
+        mock_weeks.return_value = [
+            *mock_weeks.return_value,
+            (3, date(2026, 1, 19), date(2026, 1, 25)),
+        ]
+        assert update_week(_make_mock_config()) is True
+        assert {c.args[2:] for c in mock_fetch.call_args_list} == {
+            (date(2026, 1, 19), date(2026, 1, 25))
+        }
+
+    @patch("sqp_analyzer.commands.quarterly_tracker.SheetsClient")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_quarter_weeks")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_last_complete_week")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_current_quarter")
+    @patch("sqp_analyzer.commands.quarterly_tracker.get_credentials")
+    def test_week_before_quarter_is_not_written(
+        self, _creds, mock_quarter, mock_last_week, mock_weeks, mock_sheets_cls
+    ):
+        # Thu 2026-01-08: the last complete week still belongs to Q4
+        mock_quarter.return_value = (1, 2026)
+        mock_last_week.return_value = (date(2025, 12, 28), date(2026, 1, 3))
+        mock_weeks.return_value = []
+
+        assert update_week(_make_mock_config()) is False
+        mock_sheets_cls.return_value.write_quarterly_tracker.assert_not_called()
+
 
 # --- Dashboard test helpers ---
 
@@ -639,6 +1281,16 @@ class TestExtractWeekMetrics:
         assert metrics["volume"] == 5000.0
         assert metrics["imp_share"] == 10.0
 
+    def test_numeric_cells_mixed_with_dashes(self):
+        row = ["ASIN", 1, "keyword", "YES", "NO", 5000, 10, "-", " 0.5 ", "", "", ""]
+        metrics = extract_week_metrics(row, 0)
+        assert metrics["volume"] == 5000.0
+        assert metrics["imp_share"] == 10.0
+        assert metrics["click_share"] is None
+        assert metrics["purchase_share"] == 0.5
+        assert metrics["opportunity_score"] is None
+        assert metrics["rank_status"] is None
+
     def test_out_of_bounds_week_returns_none(self):
         row = [
             "ASIN",
@@ -849,6 +1501,19 @@ class TestBuildDashboard:
         assert len(flagged_section) >= 1
         assert flagged_section[0][0] == "ASIN"
 
+    def test_does_not_modify_parsed_data(self):
+        sheet = _build_mock_consolidated_sheet(["W01", "W02"])
+        parsed = parse_consolidated_sheet(sheet)
+        keys_before = [
+            set(kw) for asin_data in parsed.values() for kw in asin_data["keywords"]
+        ]
+
+        build_dashboard(parsed, 2)
+
+        assert [
+            set(kw) for asin_data in parsed.values() for kw in asin_data["keywords"]
+        ] == keys_before
+
     def test_summary_row_count(self):
         sheet = _build_mock_consolidated_sheet(["W01"])
         parsed = parse_consolidated_sheet(sheet)
@@ -886,6 +1551,19 @@ class TestBuildDashboard:
 
 
 class TestGenerateDashboard:
+    @patch("sqp_analyzer.commands.quarterly_tracker.build_dashboard")
+    def test_week_count_ignores_trailing_header_cells(self, mock_build):
+        sheet = _build_mock_consolidated_sheet(["W01", "W02"])
+        # get_all_values pads the header to the grid width; one extra column
+        sheet[0] = [*sheet[0], "Notes", "", "", "", "", ""]
+        mock_build.return_value = ([], [], [[]])
+        mock_sheets = MagicMock()
+        mock_sheets.get_quarterly_tracker.return_value = sheet
+
+        generate_dashboard(mock_sheets, "Q1")
+
+        assert mock_build.call_args.args[1] == 2
+
     def test_reads_q_tab_and_writes_dashboard(self):
         sheet = _build_mock_consolidated_sheet(["W01", "W02"])
         mock_sheets = MagicMock()
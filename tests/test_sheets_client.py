@@ -0,0 +1,145 @@
+"""Tests for SheetsClient tab caching and batch writes."""
+
+from unittest.mock import MagicMock, patch
+
+from sqp_analyzer.config import SheetsConfig
+from sqp_analyzer.sheets.client import (
+    VALUES_CACHE_TTL,
+    WRITE_CHUNK_ROWS,
+    SheetsClient,
+)
+
+
+def _make_client() -> tuple[SheetsClient, MagicMock]:
+    client = SheetsClient(
+        SheetsConfig(
+            spreadsheet_id="test-sheet-id",
+            master_tab_name="ASINs",
+            credentials_path="test.json",
+        )
+    )
+    spreadsheet = MagicMock()
+    spreadsheet.worksheet.return_value.row_count = 1000
+    client._spreadsheet = spreadsheet
+    return client, spreadsheet
+
+
+class TestGetQuarterlyTrackerCache:
+    def test_repeat_read_is_served_from_cache(self):
+        client, spreadsheet = _make_client()
+        spreadsheet.worksheet.return_value.get_all_values.return_value = [["ASIN"]]
+
+        assert client.get_quarterly_tracker("Q1") == [["ASIN"]]
+        assert client.get_quarterly_tracker("Q1") == [["ASIN"]]
+
+        assert spreadsheet.worksheet.return_value.get_all_values.call_count == 1
+
+    def test_expired_entry_is_read_again(self):
+        client, spreadsheet = _make_client()
+        worksheet = spreadsheet.worksheet.return_value
+        worksheet.get_all_values.return_value = [["ASIN"]]
+
+        with patch("sqp_analyzer.sheets.client.time.monotonic") as mock_time:
+            mock_time.return_value = 1000.0
+            client.get_quarterly_tracker("Q1")
+            mock_time.return_value = 1000.0 + VALUES_CACHE_TTL + 1
+            client.get_quarterly_tracker("Q1")
+
+        assert worksheet.get_all_values.call_count == 2
+
+    def test_write_invalidates_cached_values(self):
+        client, spreadsheet = _make_client()
+        worksheet = spreadsheet.worksheet.return_value
+        worksheet.get_all_values.return_value = [["old"]]
+
+        client.get_quarterly_tracker("Q1")
+        client.write_quarterly_tracker("Q1", ["ASIN"], [["B0ASIN0001"]])
+        worksheet.get_all_values.return_value = [["ASIN"], ["B0ASIN0001"]]
+
+        assert client.get_quarterly_tracker("Q1") == [["ASIN"], ["B0ASIN0001"]]
+        assert worksheet.get_all_values.call_count == 2
+
+    def test_callers_cannot_modify_cached_rows(self):
+        client, spreadsheet = _make_client()
+        spreadsheet.worksheet.return_value.get_all_values.return_value = [
+            ["ASIN", "Rank"]
+        ]
+
+        client.get_quarterly_tracker("Q1")[0].append("")
+
+        assert client.get_quarterly_tracker("Q1") == [["ASIN", "Rank"]]
+
+    def test_row_update_invalidates_cache(self):
+        client, spreadsheet = _make_client()
+        worksheet = spreadsheet.worksheet.return_value
+        worksheet.get_all_values.return_value = [["ASIN"]]
+
+        client.get_quarterly_tracker("Q1")
+        client.update_quarterly_tracker_row("Q1", 2, ["B0ASIN0001"])
+        client.get_quarterly_tracker("Q1")
+
+        assert worksheet.get_all_values.call_count == 2
+
+
+class TestWorksheetHandles:
+    def test_write_then_row_update_looks_up_tab_once(self):
+        client, spreadsheet = _make_client()
+
+        client.write_quarterly_tracker("Q1", ["ASIN"], [["B0ASIN0001"]])
+        client.update_quarterly_tracker_row("Q1", 2, ["B0ASIN0002"])
+        client.write_quarterly_tracker("Q1", ["ASIN"], [["B0ASIN0003"]])
+
+        spreadsheet.worksheet.assert_called_once_with("Q1")
+
+    def test_write_is_single_raw_update(self):
+        client, spreadsheet = _make_client()
+        worksheet = spreadsheet.worksheet.return_value
+
+        client.write_quarterly_tracker("Q1", ["ASIN"], [["B0ASIN0001"]] * 500)
+
+        worksheet.update.assert_called_once()
+        kwargs = worksheet.update.call_args.kwargs
+        assert kwargs["value_input_option"] == "RAW"
+        assert len(kwargs["values"]) == 501
+
+
+class TestWriteQuarterlyTrackerChunks:
+    def test_generator_rows_are_written_in_chunks(self):
+        client, spreadsheet = _make_client()
+        worksheet = spreadsheet.worksheet.return_value
+        worksheet.row_count = 1000
+
+        def grow(n):
+            worksheet.row_count += n
+
+        worksheet.add_rows.side_effect = grow
+        total = WRITE_CHUNK_ROWS + 5
+        rows = ([f"B0ASIN{i:04d}"] for i in range(total))
+
+        client.write_quarterly_tracker("Q1", ["ASIN"], rows)
+
+        calls = worksheet.update.call_args_list
+        assert [c.kwargs["range_name"] for c in calls] == [
+            "A1",
+            f"A{WRITE_CHUNK_ROWS + 1}",
+        ]
+        assert [len(c.kwargs["values"]) for c in calls] == [WRITE_CHUNK_ROWS, 6]
+        assert worksheet.row_count >= total + 1
+        assert calls[1].kwargs["values"][-1] == [f"B0ASIN{total - 1:04d}"]
+
+
+class TestWriteTabs:
+    def test_single_batch_clear_and_update(self):
+        client, spreadsheet = _make_client()
+
+        client.write_tabs({"Traffic-ByDate": [["Date"]], "Traffic-ByASIN": [["ASIN"]]})
+
+        spreadsheet.values_batch_clear.assert_called_once_with(
+            body={"ranges": ["'Traffic-ByDate'", "'Traffic-ByASIN'"]}
+        )
+        body = spreadsheet.values_batch_update.call_args.kwargs["body"]
+        assert body["valueInputOption"] == "RAW"
+        assert [d["range"] for d in body["data"]] == [
+            "'Traffic-ByDate'!A1",
+            "'Traffic-ByASIN'!A1",
+        ]